@@ -0,0 +1 @@
+"""Shared python helpers for the dayXX solvers."""
@@ -0,0 +1,130 @@
+"""
+Solve many inputs of one day in a handful of long lived processes.
+
+Starting a python process (and importing numpy & co.) per input costs more
+than solving most days, so ``run_batch`` imports the solver once per worker
+process and then feeds it input after input. Everything the solver sets up at
+module level (lookup tables and the like) is shared by all inputs a worker
+solves, including ``functools.cache`` memos that don't depend on the input,
+like day 21's ``number_of_games_win``. Memos keyed by the input (day 17's
+``search``, day 19's ``solve``) would keep every input of the batch alive
+instead, so solvers list them in ``INPUT_CACHES`` and they are cleared after
+every input.
+
+The results of all inputs are written to one JSON file:
+
+    $ python -m aoc.batch 1 inputs/day01/ -o results.json -j 4
+"""
+
+import glob
+import json
+import os
+import time
+import traceback
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc.runner import ROOT, discover_days, load_solver, solve
+
+# solver module of the current worker process, see init_worker
+_solver = None
+
+
+def find_inputs(directory, pattern="*.txt"):
+    return sorted(
+        path for path in glob.glob(os.path.join(directory, pattern)) if os.path.isfile(path)
+    )
+
+
+def init_worker(day, directory):
+    "Load the solver once per worker process"
+    global _solver
+    os.chdir(directory)
+    _solver = load_solver(day, directory)
+
+
+def clear_input_caches(module):
+    "Clear the memos the solver keys by the input (its ``INPUT_CACHES``)"
+    for name in getattr(module, "INPUT_CACHES", ()):
+        getattr(module, name).cache_clear()
+
+
+def solve_input(path, cache_dir=None):
+    """
+    Solve one input file with the solver of this worker. Returns a dict with
+    the input path, the answers (as strings), the wall time of parse and both
+    parts in ns, whether the answers came from the cache and the formatted
+    traceback in case something failed.
+    """
+    out = {"input": path, "answers": {}, "times": {}, "cached": False, "error": None}
+    try:
+        with open(path, "rb") as f:
+            raw_data = f.read()
+        solve(_solver, raw_data, out, cache_dir=cache_dir)
+    except Exception:
+        out["error"] = traceback.format_exc()
+    finally:
+        clear_input_caches(_solver)
+    return out
+
+
+def _solve_task(args):
+    return solve_input(*args)
+
+
+def run_batch(day, inputs, jobs=None, cache_dir=None, root=ROOT):
+    """
+    Solve all ``inputs`` (a directory or a list of files) of ``day`` with
+    ``jobs`` worker processes (default: all cores; 1 solves in this process)
+    and return the list of results of ``solve_input`` in input order.
+    """
+    available = discover_days(root)
+    if day not in available:
+        raise ValueError(f"no solver found for day {day}")
+    if isinstance(inputs, str):
+        inputs = find_inputs(inputs)
+    inputs = [os.path.abspath(path) for path in inputs]
+    if cache_dir is not None:
+        cache_dir = os.path.abspath(cache_dir)
+    tasks = [(path, cache_dir) for path in inputs]
+    if jobs == 1:
+        cwd = os.getcwd()
+        try:
+            init_worker(day, available[day])
+            return [_solve_task(task) for task in tasks]
+        finally:
+            os.chdir(cwd)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=init_worker, initargs=(day, available[day])
+    ) as executor:
+        # hand out inputs in chunks to keep the inter process traffic low
+        chunksize = max(1, len(tasks) // (4 * (jobs or os.cpu_count() or 1)))
+        return list(executor.map(_solve_task, tasks, chunksize=chunksize))
+
+
+def write_results(path, day, results):
+    with open(path, "w") as f:
+        json.dump({"day": day, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("day", type=int)
+    parser.add_argument("inputs", help="directory with one input per file")
+    parser.add_argument("--pattern", default="*.txt", help="input file names (default: *.txt)")
+    parser.add_argument("-j", "--jobs", type=int, help="number of worker processes (default: all cores)")
+    parser.add_argument("-o", "--output", default="results.json")
+    parser.add_argument("--cache-dir", help="reuse answers of inputs that were already solved")
+    args = parser.parse_args()
+
+    start = time.perf_counter_ns()
+    paths = find_inputs(args.inputs, args.pattern)
+    results = run_batch(args.day, paths, jobs=args.jobs, cache_dir=args.cache_dir)
+    write_results(args.output, args.day, results)
+    failed = [result for result in results if result["error"] is not None]
+    print(
+        f"day {args.day}: {len(results)} inputs, {len(failed)} failed, "
+        f"{(time.perf_counter_ns() - start) / 1e9:.2f} s -> {args.output}"
+    )
+    for result in failed:
+        print(f"{result['input']}: {result['error'].strip().splitlines()[-1]}")
@@ -0,0 +1,152 @@
+"""
+Benchmarks of the solver functions with stored baselines.
+
+For every day, ``parse``, ``solve1``, ``solve2`` and alternative
+implementations (``solve2_alternative`` & co.) are run ``repeat`` times after
+``warmup`` untimed runs. The median and 95th percentile are compared to a
+JSON baseline; a function counts as regressed if its median got slower than
+the baseline by more than ``threshold`` (relative) and ``min_delta_ns``
+(absolute, to ignore noise of sub-millisecond functions).
+
+The solve functions get freshly parsed data for every run since some of
+them modify their input.
+
+``scaling`` benchmarks the functions on synthetic inputs of increasing size
+and reports how the median grows with the input size.
+"""
+
+import json
+import math
+import os
+import re
+import time
+
+from aoc.generators import DEFAULT_SIZES, generate
+from aoc.runner import discover_days, load_solver
+
+BENCHMARKED = re.compile(r"^(parse|solve[12]\w*)$")
+
+
+def benchmarked_functions(module):
+    "name -> undecorated function for parse, solve1, solve2 and alternatives"
+    out = {}
+    for name, func in vars(module).items():
+        if BENCHMARKED.match(name) and callable(func):
+            out[name] = getattr(func, "__wrapped__", func)
+    return dict(sorted(out.items(), key=lambda item: (item[0] != "parse", item[0])))
+
+
+def percentile(values, q):
+    values = sorted(values)
+    pos = (len(values) - 1) * q
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def time_function(func, make_args, repeat=5, warmup=1, max_time=None):
+    """
+    Time ``func(*make_args())`` and return the list of wall times in ns.
+    Stops early (after at least one timed run) once ``max_time`` seconds have
+    been spent in timed runs.
+    """
+    for _ in range(warmup):
+        func(*make_args())
+    times = []
+    for _ in range(repeat):
+        args = make_args()
+        start = time.perf_counter_ns()
+        func(*args)
+        times.append(time.perf_counter_ns() - start)
+        if max_time is not None and sum(times) > max_time * 1e9:
+            break
+    return times
+
+
+def summarize(times):
+    return {
+        "runs": len(times),
+        "median": percentile(times, 0.5),
+        "p95": percentile(times, 0.95),
+        "min": min(times),
+    }
+
+
+def benchmark_day(day, directory, raw_data=None, **kwargs):
+    "Return a dict function name -> summary for one day"
+    cwd = os.getcwd()
+    try:
+        os.chdir(directory)
+        module = load_solver(day, directory)
+        if raw_data is None:
+            with open("input.txt") as f:
+                raw_data = f.read().strip()
+        results = {}
+        for name, func in benchmarked_functions(module).items():
+            if name == "parse":
+                make_args = lambda: (raw_data,)
+            else:
+                make_args = lambda: (module.parse(raw_data),)
+            results[name] = summarize(time_function(func, make_args, **kwargs))
+        return results
+    finally:
+        os.chdir(cwd)
+
+
+def benchmark(days=None, **kwargs):
+    available = discover_days()
+    results = {}
+    for day in days or available:
+        for name, summary in benchmark_day(day, available[day], **kwargs).items():
+            results[f"day{day:02d}.{name}"] = summary
+    return results
+
+
+def load_baseline(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path, results):
+    baseline = load_baseline(path)
+    baseline.update(results)
+    with open(path, "w") as f:
+        json.dump(dict(sorted(baseline.items())), f, indent=2)
+
+
+def compare(results, baseline, threshold=0.2, min_delta_ns=1_000_000):
+    """
+    Return a list of (key, baseline median, new median, relative change) for
+    all regressed functions.
+    """
+    regressions = []
+    for key, summary in results.items():
+        if key not in baseline:
+            continue
+        old, new = baseline[key]["median"], summary["median"]
+        if new > old * (1 + threshold) and new - old > min_delta_ns:
+            regressions.append((key, old, new, new / old - 1))
+    return regressions
+
+
+def scaling(day, factors=(1, 2, 4, 8), seed=0, **kwargs):
+    """
+    Benchmark one day on synthetic inputs (see ``aoc.generators``) of
+    ``factor`` times the default size for each of ``factors``. Returns a dict
+    function name -> list of (factor, median) and the estimated exponent of
+    the growth (slope in log-log between smallest and largest factor).
+    """
+    directory = discover_days()[day]
+    medians = {}
+    for factor in factors:
+        raw_data = generate(day, max(1, round(DEFAULT_SIZES[day] * factor)), seed=seed)
+        for name, summary in benchmark_day(day, directory, raw_data, **kwargs).items():
+            medians.setdefault(name, []).append((factor, summary["median"]))
+    out = {}
+    for name, points in medians.items():
+        (f0, t0), (f1, t1) = points[0], points[-1]
+        exponent = math.log(t1 / t0) / math.log(f1 / f0) if f1 != f0 and t0 > 0 else None
+        out[name] = (points, exponent)
+    return out
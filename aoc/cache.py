@@ -0,0 +1,120 @@
+"""
+Persistent cache for the answers of the solvers.
+
+Entries are keyed by a hash of the puzzle input, the source of the solver
+module and of the ``aoc`` modules it imports (directly or through other
+``aoc`` modules, e.g. ``aoc.grid``) and the name of the solve function, so an
+entry is invalidated as soon as either the input or any code the solver
+depends on changes. Each entry is a
+small JSON file; reading an entry updates its modification time, and the
+least recently used entries are removed once the cache grows beyond
+``max_bytes``.
+"""
+
+import ast
+import hashlib
+import importlib
+import inspect
+import json
+import os
+
+
+def aoc_imports(source):
+    "Names of the ``aoc`` modules imported anywhere in ``source``"
+    names = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names if alias.name.startswith("aoc."))
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            if node.module == "aoc":
+                # from aoc import grid
+                names.update(f"aoc.{alias.name}" for alias in node.names)
+            elif node.module.startswith("aoc."):
+                names.add(node.module)
+    return names
+
+
+def sources(module):
+    "Source of ``module`` followed by the ones of the ``aoc`` modules it depends on"
+    source = inspect.getsource(module)
+    seen = {}
+    todo = sorted(aoc_imports(source))
+    while todo:
+        name = todo.pop()
+        if name in seen or name == module.__name__:
+            continue
+        try:
+            seen[name] = inspect.getsource(importlib.import_module(name))
+        except ImportError:
+            # "from aoc import x" where x is no module
+            continue
+        todo.extend(aoc_imports(seen[name]))
+    return [source] + [seen[name] for name in sorted(seen)]
+
+
+def make_key(raw_data, module, name):
+    if isinstance(raw_data, str):
+        raw_data = raw_data.encode()
+    h = hashlib.sha256()
+    for part in (raw_data, *(source.encode() for source in sources(module)), name.encode()):
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory, max_bytes=10 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                value = json.load(f)["value"]
+        except (OSError, ValueError, KeyError):
+            return default
+        os.utime(path)
+        return value
+
+    def set(self, key, value):
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"value": value}, f)
+        os.replace(tmp, path)
+        self.evict()
+
+    def entries(self):
+        "List of (mtime, size, path), least recently used first"
+        out = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            out.append((stat.st_mtime_ns, stat.st_size, path))
+        return sorted(out)
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
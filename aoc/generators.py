@@ -0,0 +1,524 @@
+"""
+Generators for synthetic puzzle inputs of arbitrary size.
+
+``generate(day, size, seed)`` returns the input as a string in exactly the
+format of the puzzle input (so it can be fed to ``parse`` or written to a
+file). What ``size`` means depends on the day (number of lines, side length
+of a grid, number of boards, ...); ``DEFAULT_SIZES`` holds roughly the size
+of the real puzzle input. A few puzzles have an input of fixed size (days
+17, 21, 23) - there ``size`` is ignored and only the content is random.
+
+The inputs are valid in the sense of the puzzle description, but note that
+some solvers rely on properties of the real inputs; where that matters for
+the answer to exist at all (day 11 part 2 needs the octopuses to
+synchronize) the generator makes sure it does.
+
+    $ python -m aoc.generators 9 10000 > /tmp/day09_large.txt
+"""
+
+import itertools
+import math
+import random
+import sys
+
+GENERATORS = {}
+DEFAULT_SIZES = {}
+
+
+def generator(day, default_size):
+    def register(func):
+        GENERATORS[day] = func
+        DEFAULT_SIZES[day] = default_size
+        return func
+
+    return register
+
+
+def generate(day, size=None, seed=0):
+    if day not in GENERATORS:
+        raise ValueError(f"no input generator for day {day}")
+    if size is None:
+        size = DEFAULT_SIZES[day]
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def digit_grid(size, rng, digits="0123456789", width=None):
+    width = width or size
+    return "\n".join("".join(rng.choices(digits, k=width)) for _ in range(size))
+
+
+@generator(1, 2000)
+def day01(size, rng):
+    "``size`` depth readings (a random walk)"
+    depth = 100
+    out = []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-5, 15))
+        out.append(depth)
+    return "\n".join(map(str, out))
+
+
+@generator(2, 1000)
+def day02(size, rng):
+    "``size`` commands, the depth/aim never gets negative"
+    out = []
+    depth = 0
+    for _ in range(size):
+        instruction = rng.choice(("forward", "down", "up"))
+        value = rng.randint(1, 9)
+        if instruction == "up" and value > depth:
+            instruction = "down"
+        depth += {"forward": 0, "down": value, "up": -value}[instruction]
+        out.append(f"{instruction} {value}")
+    return "\n".join(out)
+
+
+@generator(3, 1000)
+def day03(size, rng):
+    "``size`` distinct binary numbers, at least 12 bits wide"
+    width = max(12, math.ceil(math.log2(size)) + 1)
+    return "\n".join(f"{i:0{width}b}" for i in rng.sample(range(2 ** width), size))
+
+
+@generator(4, 100)
+def day04(size, rng):
+    "draw all numbers 0-99 and ``size`` 5x5 boards"
+    numbers = list(range(100))
+    rng.shuffle(numbers)
+    out = [",".join(map(str, numbers))]
+    for _ in range(size):
+        board = rng.sample(range(100), 25)
+        out.append(
+            "\n".join(
+                " ".join(f"{i:2}" for i in board[row * 5: row * 5 + 5])
+                for row in range(5)
+            )
+        )
+    return "\n\n".join(out)
+
+
+@generator(5, 500)
+def day05(size, rng, extent=1000):
+    "``size`` horizontal, vertical and diagonal lines on a ``extent`` x ``extent`` map"
+    out = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(extent), rng.randrange(extent)
+        kind = rng.choice(("h", "v", "d"))
+        if kind == "h":
+            x2, y2 = rng.randrange(extent), y1
+        elif kind == "v":
+            x2, y2 = x1, rng.randrange(extent)
+        else:
+            dx, dy = rng.choice((-1, 1)), rng.choice((-1, 1))
+            max_len = min(
+                x1 if dx < 0 else extent - 1 - x1,
+                y1 if dy < 0 else extent - 1 - y1,
+            )
+            n = rng.randint(0, max_len)
+            x2, y2 = x1 + dx * n, y1 + dy * n
+        out.append(f"{x1},{y1} -> {x2},{y2}")
+    return "\n".join(out)
+
+
+@generator(6, 300)
+def day06(size, rng):
+    "``size`` lanternfish timers"
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size))
+
+
+@generator(7, 1000)
+def day07(size, rng, extent=2000):
+    "``size`` crab positions"
+    return ",".join(str(int(rng.expovariate(1 / (extent / 4))) % extent) for _ in range(size))
+
+
+SEGMENTS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+
+
+@generator(8, 200)
+def day08(size, rng):
+    "``size`` displays, each with its own wiring"
+    out = []
+    for _ in range(size):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+
+        def scrambled(digit):
+            letters = [wiring[c] for c in SEGMENTS[digit]]
+            rng.shuffle(letters)
+            return "".join(letters)
+
+        patterns = [scrambled(d) for d in rng.sample(range(10), 10)]
+        output = [scrambled(rng.randrange(10)) for _ in range(4)]
+        out.append(" ".join(patterns) + " | " + " ".join(output))
+    return "\n".join(out)
+
+
+@generator(9, 100)
+def day09(size, rng):
+    "``size`` x ``size`` heightmap"
+    return digit_grid(size, rng)
+
+
+@generator(10, 100)
+def day10(size, rng, length=100):
+    "``size`` lines of about ``length`` brackets, corrupted or incomplete"
+    pairs = {"(": ")", "[": "]", "{": "}", "<": ">"}
+    out = []
+    for _ in range(size):
+        line, stack = [], []
+        corrupted = rng.random() < 0.5
+        while len(line) < length:
+            if stack and rng.random() < 0.45:
+                line.append(pairs[stack.pop()])
+            else:
+                opening = rng.choice("([{<")
+                stack.append(opening)
+                line.append(opening)
+        if corrupted and stack:
+            wrong = [c for c in pairs.values() if c != pairs[stack[-1]]]
+            line.append(rng.choice(wrong))
+        elif not stack:
+            line.append(rng.choice("([{<"))
+        out.append("".join(line))
+    return "\n".join(out)
+
+
+def octopus_sync_step(grid, size, max_steps):
+    "First step at which all octopuses of the flat ``grid`` flash, or None"
+    neighbours = [
+        [
+            y * size + x
+            for y in range(max(0, row - 1), min(size, row + 2))
+            for x in range(max(0, col - 1), min(size, col + 2))
+            if (y, x) != (row, col)
+        ]
+        for row in range(size)
+        for col in range(size)
+    ]
+    grid = list(grid)
+    for step in range(1, max_steps + 1):
+        grid = [level + 1 for level in grid]
+        todo = [cell for cell, level in enumerate(grid) if level > 9]
+        flashed = set(todo)
+        while todo:
+            for other in neighbours[todo.pop()]:
+                grid[other] += 1
+                if grid[other] > 9 and other not in flashed:
+                    flashed.add(other)
+                    todo.append(other)
+        if len(flashed) == len(grid):
+            return step
+        for cell in flashed:
+            grid[cell] = 0
+    return None
+
+
+@generator(11, 10)
+def day11(size, rng, attempts=10, max_steps=1000):
+    """
+    ``size`` x ``size`` octopus energy levels that are guaranteed to all
+    flash at once eventually (part 2). Random grids don't always get there
+    (about 4 in 10 at 10x10 don't within thousands of steps, and practically
+    none from 40x40 on), so up to 20x20 random grids are drawn until one
+    synchronizes within ``max_steps``. Otherwise all levels are one of two
+    neighbouring random values, which synchronizes as soon as the higher
+    ones flash.
+    """
+    if size <= 20:
+        for _ in range(attempts):
+            grid = rng.choices(range(10), k=size * size)
+            if octopus_sync_step(grid, size, max_steps) is not None:
+                return "\n".join("".join(map(str, grid[i:i + size])) for i in range(0, size * size, size))
+    low = rng.randrange(9)
+    return digit_grid(size, rng, digits=f"{low}{low + 1}")
+
+
+@generator(12, 10)
+def day12(size, rng):
+    """
+    cave system with ``size`` small caves and about ``size / 3`` big caves;
+    big caves are never connected to each other (that would allow infinitely
+    many paths). The number of paths grows exponentially with ``size``.
+    """
+    names = ("".join(c) for c in itertools.product("abcdefghijklmnopqrstuvwxyz", repeat=2))
+    small = ["start", "end"] + [next(names) for _ in range(size)]
+    big = [next(names).upper() for _ in range(max(1, size // 3))]
+    edges = set()
+    for cave in small[2:]:
+        edges.add((cave, rng.choice(big)))
+    for _ in range(size // 2):
+        a, b = rng.sample(small, 2)
+        if {a, b} != {"start", "end"}:
+            edges.add((a, b))
+    hub = rng.choice(big)
+    edges.add(("start", hub))
+    edges.add((hub, "end"))
+    return "\n".join(f"{a}-{b}" for a, b in sorted(edges))
+
+
+@generator(13, 1000)
+def day13(size, rng, n_folds=12):
+    """
+    ``size`` dots and ``n_folds`` folds that end up on a 40 x 6 sheet; dots
+    are created on the final sheet and randomly mirrored while unfolding,
+    so no dot lies on a fold line
+    """
+    width, height = 40, 6
+    folds = []
+    for i in range(n_folds):
+        if i % 2 == 0:
+            folds.append(("x", width))
+            width = 2 * width + 1
+        else:
+            folds.append(("y", height))
+            height = 2 * height + 1
+    dots = set()
+    while len(dots) < size:
+        x, y = rng.randrange(40), rng.randrange(6)
+        for axis, pos in folds:
+            if rng.random() < 0.5:
+                if axis == "x":
+                    x = 2 * pos - x
+                else:
+                    y = 2 * pos - y
+        dots.add((x, y))
+    instructions = [f"fold along {axis}={pos}" for axis, pos in reversed(folds)]
+    return "\n".join(f"{x},{y}" for x, y in dots) + "\n\n" + "\n".join(instructions)
+
+
+@generator(14, 20)
+def day14(size, rng, elements="BCFHKNOPSV"):
+    "polymer template of length ``size`` and insertion rules for all pairs"
+    template = "".join(rng.choices(elements, k=size))
+    rules = [f"{a}{b} -> {rng.choice(elements)}" for a in elements for b in elements]
+    return template + "\n\n" + "\n".join(rules)
+
+
+@generator(15, 100)
+def day15(size, rng):
+    "``size`` x ``size`` risk levels"
+    return digit_grid(size, rng, digits="123456789")
+
+
+def encode_packet(rng, n_packets):
+    "bits of a random packet tree with ``n_packets`` packets in total"
+    version = f"{rng.randrange(8):03b}"
+    if n_packets == 1:
+        value = rng.randrange(1, 2 ** 12)
+        nibbles = f"{value:b}"
+        nibbles = nibbles.zfill(-(-len(nibbles) // 4) * 4)
+        groups = [nibbles[i: i + 4] for i in range(0, len(nibbles), 4)]
+        return version + "100" + "".join(
+            ("0" if i == len(groups) - 1 else "1") + group for i, group in enumerate(groups)
+        )
+    budget = n_packets - 1
+    if budget >= 2 and rng.random() < 0.2:
+        type_id = rng.choice((5, 6, 7))
+        n_children = 2
+    else:
+        type_id = rng.choice((0, 1, 2, 3))
+        n_children = rng.randint(1, min(budget, 4))
+    # split the budget between the children, every child gets at least one packet
+    cuts = sorted(rng.sample(range(1, budget), n_children - 1))
+    sizes = [b - a for a, b in zip([0] + cuts, cuts + [budget])]
+    children = "".join(encode_packet(rng, n) for n in sizes)
+    if len(children) < 2 ** 15 and rng.random() < 0.5:
+        header = "0" + f"{len(children):015b}"
+    else:
+        header = "1" + f"{n_children:011b}"
+    return version + f"{type_id:03b}" + header + children
+
+
+@generator(16, 60)
+def day16(size, rng):
+    "BITS transmission with ``size`` (nested) packets"
+    bits = encode_packet(rng, size)
+    bits += "0" * (-len(bits) % 8)
+    return "".join(f"{int(bits[i: i + 4], 2):X}" for i in range(0, len(bits), 4))
+
+
+@generator(17, 1)
+def day17(size, rng):
+    "target area (fixed size; within the velocity range searched by the solver)"
+    x0 = rng.randint(20, 250)
+    y0 = rng.randint(-100, -30)
+    return f"target area: x={x0}..{x0 + rng.randint(5, 30)}, y={y0}..{y0 + rng.randint(5, 25)}"
+
+
+def snailfish_number(rng, depth=0):
+    if depth == 4 or (depth > 0 and rng.random() < 0.3):
+        return str(rng.randrange(10))
+    return f"[{snailfish_number(rng, depth + 1)},{snailfish_number(rng, depth + 1)}]"
+
+
+@generator(18, 100)
+def day18(size, rng):
+    "``size`` reduced snailfish numbers"
+    return "\n".join(snailfish_number(rng) for _ in range(size))
+
+
+def rotations():
+    "the 24 proper rotations of 3d coordinates as (permutation, signs)"
+    out = []
+    for perm in itertools.permutations(range(3)):
+        parity = sum(perm[i] > perm[j] for i in range(3) for j in range(i + 1, 3)) % 2
+        for signs in itertools.product((1, -1), repeat=3):
+            if (signs[0] * signs[1] * signs[2] == 1) == (parity == 0):
+                out.append((perm, signs))
+    return out
+
+
+@generator(19, 30)
+def day19(size, rng, n_overlap=12, n_extra=4):
+    """
+    ``size`` scanners on a random walk with steps of about 1200 along a
+    random axis, so that consecutive scanners share at least ``n_overlap``
+    beacons; each scanner reports the beacons within 1000 in its own random
+    orientation
+    """
+    positions = [(0, 0, 0)]
+    for _ in range(size - 1):
+        step = [rng.randint(-200, 200) for _ in range(3)]
+        step[rng.randrange(3)] = rng.choice((-1, 1)) * rng.randint(1000, 1300)
+        positions.append(tuple(c + d for c, d in zip(positions[-1], step)))
+    beacons = set()
+
+    def random_beacons(lo, hi, n):
+        while n > 0:
+            beacon = tuple(rng.randint(a, b) for a, b in zip(lo, hi))
+            if beacon not in beacons:
+                beacons.add(beacon)
+                n -= 1
+
+    for p0, p1 in zip(positions, positions[1:]):
+        lo = [max(a, b) - 1000 for a, b in zip(p0, p1)]
+        hi = [min(a, b) + 1000 for a, b in zip(p0, p1)]
+        random_beacons(lo, hi, n_overlap)
+    for p in positions:
+        random_beacons([c - 1000 for c in p], [c + 1000 for c in p], n_extra)
+    all_rotations = rotations()
+    out = []
+    for i, p in enumerate(positions):
+        perm, signs = rng.choice(all_rotations)
+        out.append(f"--- scanner {i} ---")
+        for beacon in beacons:
+            rel = [b - c for b, c in zip(beacon, p)]
+            if all(abs(c) <= 1000 for c in rel):
+                out.append(",".join(str(rel[perm[k]] * signs[k]) for k in range(3)))
+        out.append("")
+    return "\n".join(out).strip()
+
+
+@generator(20, 100)
+def day20(size, rng):
+    "image enhancement algorithm and a ``size`` x ``size`` image"
+    algorithm = rng.choices("#.", k=512)
+    # light pixels in the infinite background have to go dark again
+    algorithm[0], algorithm[511] = "#", "."
+    return "".join(algorithm) + "\n\n" + digit_grid(size, rng, digits="#.")
+
+
+@generator(21, 1)
+def day21(size, rng):
+    "starting positions (fixed size)"
+    return "\n".join(f"Player {i} starting position: {rng.randint(1, 10)}" for i in (1, 2))
+
+
+@generator(22, 420)
+def day22(size, rng):
+    "``size`` reboot steps, the first 20 within the -50..50 initialization region"
+    out = []
+    for i in range(size):
+        if i < 20:
+            extent, length = 50, 50
+        else:
+            extent, length = 100000, 30000
+        ranges = []
+        for axis in "xyz":
+            lo = rng.randint(-extent, extent - 1)
+            hi = min(extent, lo + rng.randint(1, length))
+            ranges.append(f"{axis}={lo}..{hi}")
+        onoff = "on" if i < 2 or rng.random() < 0.6 else "off"
+        out.append(f"{onoff} " + ",".join(ranges))
+    return "\n".join(out)
+
+
+@generator(23, 1)
+def day23(size, rng):
+    "burrow with randomly placed amphipods (fixed size)"
+    amphipods = list("AABBCCDD")
+    rng.shuffle(amphipods)
+    return "\n".join([
+        "#############",
+        "#...........#",
+        "###" + "#".join(amphipods[:4]) + "###",
+        "  #" + "#".join(amphipods[4:]) + "#",
+        "  #########",
+    ])
+
+
+MONAD_BLOCK = """inp w
+mul x 0
+add x z
+mod x 26
+div z {a}
+add x {b}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {c}
+mul y x
+add z y"""
+
+
+@generator(24, 14)
+def day24(size, rng):
+    """
+    MONAD program for a model number with ``size`` (even) digits: pushing
+    and popping blocks are nested like random balanced brackets and chosen so
+    that a valid model number exists
+    """
+    n_pairs = max(1, size // 2)
+    # random balanced sequence of push (True) and pop (False)
+    sequence, open_count, pushes_left = [], 0, n_pairs
+    while pushes_left or open_count:
+        if pushes_left and (open_count == 0 or rng.random() < 0.5):
+            sequence.append(True)
+            open_count += 1
+            pushes_left -= 1
+        else:
+            sequence.append(False)
+            open_count -= 1
+    blocks, stack = [], []
+    for push in sequence:
+        if push:
+            c = rng.randint(0, 16)
+            stack.append(c)
+            blocks.append(MONAD_BLOCK.format(a=1, b=rng.randint(10, 16), c=c))
+        else:
+            c_push = stack.pop()
+            # w_pop = w_push + c_push + b, which has to be possible for some digits
+            b = rng.randint(-8, 8) - c_push
+            blocks.append(MONAD_BLOCK.format(a=26, b=b, c=rng.randint(0, 16)))
+    return "\n".join(blocks)
+
+
+@generator(25, 137)
+def day25(size, rng):
+    "``size`` x ``size`` sea floor with sea cucumbers"
+    return "\n".join(
+        "".join(rng.choices(".>v", weights=(2, 1, 1), k=size)) for _ in range(size)
+    )
+
+
+if __name__ == "__main__":
+    day = int(sys.argv[1])
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    sys.stdout.write(generate(day, size, seed))
@@ -0,0 +1,52 @@
+"""
+Character grids (as in days 9, 11, 15 and 25) as numpy arrays.
+
+``parse_grid`` turns a rectangular block of text into a 2d ``uint8`` array of
+the character codes. For bytes-like input (e.g. a memory mapped file from
+``map_file``) the array is a read-only view of the buffer: the newlines are
+skipped via the row stride, so nothing is copied and no python objects are
+created per cell.
+
+    grid = parse_grid(map_file("input.txt"))
+    heights = to_digits(grid)
+"""
+
+import mmap
+
+import numpy as np
+
+WHITESPACE = b" \t\r\n"
+
+
+def map_file(path):
+    "Memory map a file read-only (stays mapped as long as it is referenced)"
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def parse_grid(raw_data):
+    if isinstance(raw_data, str):
+        raw_data = raw_data.strip().encode()
+    start, end = 0, len(raw_data)
+    while start < end and raw_data[start] in WHITESPACE:
+        start += 1
+    while end > start and raw_data[end - 1] in WHITESPACE:
+        end -= 1
+    if start == end:
+        return np.zeros((0, 0), dtype=np.uint8)
+    width = raw_data.find(b"\n", start, end) - start
+    if width < 0:
+        width = end - start
+    stride = width + 1
+    buffer = np.frombuffer(raw_data, dtype=np.uint8, count=end - start, offset=start)
+    if (end - start + 1) % stride != 0 or (buffer[width::stride] != ord("\n")).any():
+        raise ValueError("grid lines don't all have the same length")
+    height = (end - start + 1) // stride
+    return np.lib.stride_tricks.as_strided(
+        buffer, shape=(height, width), strides=(stride, 1), writeable=False
+    )
+
+
+def to_digits(grid):
+    "Grid of the digits 0-9 (uint8) from a grid of character codes"
+    return grid - np.uint8(ord("0"))
@@ -0,0 +1,109 @@
+"""
+Metadata of the solvers without importing them.
+
+``solvers()`` reads every ``dayXX/solver.py`` with ``ast`` to find its
+functions and imports (all of them, and the ``eager_imports`` at module
+level, which are paid for as soon as the solver is loaded), so listing or checking days doesn't pay for numpy,
+networkx & co. - they are only imported once a solver actually runs.
+``import_times(day)`` imports one solver in a fresh interpreter with
+``python -X importtime`` to see how long that takes and which dependencies
+are responsible.
+"""
+
+import ast
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from aoc.runner import ROOT, discover_days
+
+
+@dataclass
+class SolverInfo:
+    day: int
+    directory: str
+    functions: list = field(default_factory=list)
+    measured: list = field(default_factory=list)
+    imports: list = field(default_factory=list)
+    eager_imports: list = field(default_factory=list)
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, "solver.py")
+
+    @property
+    def has_stream(self):
+        return "solve_stream" in self.functions
+
+
+def top_level_modules(node):
+    if isinstance(node, ast.Import):
+        return [alias.name.split(".")[0] for alias in node.names]
+    if isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+        return [node.module.split(".")[0]]
+    return []
+
+
+def scan(day, directory):
+    with open(os.path.join(directory, "solver.py")) as f:
+        tree = ast.parse(f.read())
+    info = SolverInfo(day, directory)
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            info.functions.append(node.name)
+            if any(
+                isinstance(d, ast.Name) and d.id == "measure_time"
+                for d in node.decorator_list
+            ):
+                info.measured.append(node.name)
+        for module in top_level_modules(node):
+            if module not in info.eager_imports:
+                info.eager_imports.append(module)
+    # imports anywhere in the module, including the lazy ones inside functions
+    for node in ast.walk(tree):
+        for module in top_level_modules(node):
+            if module not in info.imports:
+                info.imports.append(module)
+    return info
+
+
+def solvers(root=ROOT):
+    return {day: scan(day, directory) for day, directory in discover_days(root).items()}
+
+
+MARKER = "--- loading solver ---"
+
+
+def import_times(day, root=ROOT):
+    """
+    Import the solver of ``day`` in a fresh interpreter. Returns the total
+    import time in us and a list of (module, cumulative us) of the top level
+    imports, slowest first.
+    """
+    directory = discover_days(root)[day]
+    code = (
+        f"import sys; sys.path.insert(0, {root!r}); "
+        "from aoc.runner import load_solver; "
+        f"sys.stderr.write({MARKER!r} + '\\n'); sys.stderr.flush(); "
+        f"load_solver({day}, {directory!r})"
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=directory,
+        check=True,
+    )
+    # only count what is imported by the solver itself
+    lines = process.stderr.split(MARKER, 1)[1].splitlines()
+    modules = []
+    for line in lines:
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # nested imports are indented
+        if not name.startswith("  "):
+            modules.append((name.strip(), int(cumulative)))
+    modules.sort(key=lambda m: -m[1])
+    return sum(us for _, us in modules), modules
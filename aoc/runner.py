@@ -0,0 +1,190 @@
+"""
+Run the solvers of several days in parallel worker processes.
+
+Every day is run in its own directory (so ``input.txt`` and any files the
+solver writes are where they would be with ``cd dayXX; python solver.py``)
+and reports its answers and the timings recorded by ``aoc.timing``.
+Days are submitted longest-first according to the timings of the previous
+run, so the slow days don't end up as the tail of the run.
+
+With a ``cache_dir``, answers are stored in an ``aoc.cache.ResultCache`` and
+days whose input and solver didn't change are not run again.
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import re
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc.cache import ResultCache, make_key
+from aoc.timing import recorder, format_ns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAY_PATTERN = re.compile(r"^day(\d\d)$")
+PARTS = ("solve1", "solve2")
+
+
+def discover_days(root=ROOT):
+    "Return a dict day number -> directory for every dayXX/solver.py"
+    days = {}
+    for name in sorted(os.listdir(root)):
+        match = DAY_PATTERN.match(name)
+        if match and os.path.isfile(os.path.join(root, name, "solver.py")):
+            days[int(match.group(1))] = os.path.join(root, name)
+    return days
+
+
+def load_solver(day, directory):
+    spec = importlib.util.spec_from_file_location(
+        f"day{day:02d}_solver", os.path.join(directory, "solver.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def solve(module, raw_data, out, cache_dir=None):
+    """
+    Answers of the solver ``module`` for ``raw_data`` (bytes), from the cache
+    in ``cache_dir`` if possible. Fills in ``out["answers"]`` (as strings),
+    the wall time of parse and both parts in ``out["times"]`` (ns) and
+    ``out["cached"]``. Whatever the solver prints is dropped, it would only
+    end up interleaved with the output of other days or inputs.
+    """
+    if cache_dir is not None:
+        cache = ResultCache(cache_dir)
+        keys = {part: make_key(raw_data, module, part) for part in PARTS}
+        cached = {part: cache.get(key) for part, key in keys.items()}
+        if all(answer is not None for answer in cached.values()):
+            out["answers"] = cached
+            out["cached"] = True
+            return out
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter_ns()
+        data = module.parse(raw_data.decode().strip())
+        out["times"]["parse"] = time.perf_counter_ns() - start
+        for part in PARTS:
+            start = time.perf_counter_ns()
+            out["answers"][part] = str(getattr(module, part)(data))
+            out["times"][part] = time.perf_counter_ns() - start
+    if cache_dir is not None:
+        for part, key in keys.items():
+            cache.set(key, out["answers"][part])
+    return out
+
+
+def run_day(day, directory, input_file="input.txt", cache_dir=None):
+    """
+    Run parse, solve1 and solve2 of one day and return a dict with the
+    answers (as strings), the wall time per function in ns, whether the
+    answers came from the cache and the formatted traceback in case
+    something failed.
+    """
+    out = {"day": day, "answers": {}, "times": {}, "cached": False, "error": None}
+    cwd = os.getcwd()
+    try:
+        os.chdir(directory)
+        module = load_solver(day, directory)
+        with open(input_file, "rb") as f:
+            raw_data = f.read()
+        solve(module, raw_data, out, cache_dir=cache_dir)
+    except Exception:
+        out["error"] = traceback.format_exc()
+    finally:
+        os.chdir(cwd)
+    for name, stats in recorder.items(f"day{day:02d}_solver"):
+        out["times"][name] = stats.wall_ns
+    return out
+
+
+def total_ns(result):
+    "Time spent in parse, solve1 and solve2 (nested measured functions are included in those)"
+    return sum(result["times"].get(name, 0) for name in ("parse",) + PARTS)
+
+
+def load_timings(path):
+    try:
+        with open(path) as f:
+            return {int(day): ns for day, ns in json.load(f).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_timings(path, results):
+    timings = load_timings(path)
+    for result in results:
+        if result["error"] is None and not result["cached"]:
+            timings[result["day"]] = total_ns(result)
+    with open(path, "w") as f:
+        json.dump({str(day): ns for day, ns in sorted(timings.items())}, f, indent=2)
+
+
+def schedule(days, timings):
+    "Longest first; days without previous timing are assumed to be slow"
+    return sorted(days, key=lambda day: (-timings.get(day, float("inf")), day))
+
+
+def run_all(days=None, jobs=None, timings_file=None, cache_dir=None, root=ROOT):
+    available = discover_days(root)
+    if days is None:
+        days = list(available)
+    missing = [day for day in days if day not in available]
+    if missing:
+        raise ValueError(f"no solver found for day(s) {', '.join(map(str, missing))}")
+    timings = load_timings(timings_file) if timings_file else {}
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(run_day, day, available[day], cache_dir=cache_dir)
+            for day in schedule(days, timings)
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+    results.sort(key=lambda result: result["day"])
+    if timings_file:
+        save_timings(timings_file, results)
+    return results
+
+
+def print_results(results, file=None):
+    print(
+        f"{'day':>3}  {'part 1':>18}  {'part 2':>18}"
+        + "".join(f"{name:>12}" for name in ("parse",) + PARTS + ("total",)),
+        file=file,
+    )
+    multiline = []
+    for result in results:
+        day = result["day"]
+        if result["error"] is not None:
+            print(f"{day:>3}  failed: {result['error'].strip().splitlines()[-1]}", file=file)
+            continue
+        answers = []
+        for i, part in enumerate(PARTS, 1):
+            answer = result["answers"].get(part, "")
+            if "\n" in answer:
+                multiline.append((day, i, answer))
+                answer = "(see below)"
+            answers.append(answer)
+        times = result["times"]
+        if result["cached"]:
+            print(f"{day:>3}  {answers[0]:>18}  {answers[1]:>18}{'(cached)':>12}", file=file)
+            continue
+        print(
+            f"{day:>3}  {answers[0]:>18}  {answers[1]:>18}"
+            + "".join(
+                f"{format_ns(times.get(name)):>12}"
+                for name in ("parse",) + PARTS
+            )
+            + f"{format_ns(total_ns(result)):>12}",
+            file=file,
+        )
+    print("----------------", file=file)
+    total = sum(total_ns(r) for r in results if r["error"] is None)
+    print(f"{'sum over days':20}{format_ns(total):>12}", file=file)
+    for day, part, answer in multiline:
+        print(f"\nDay {day} part {part}:{answer}", file=file)
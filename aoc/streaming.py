@@ -0,0 +1,41 @@
+"""
+Streaming input for the line oriented days.
+
+Solvers that support it define ``solve_stream(lines)``, which takes any
+iterable of lines (e.g. an open file), goes through it once and returns the
+answers of both parts, without holding the whole input in memory.
+
+    $ python -m aoc.streaming 1 /tmp/huge_day01_input.txt
+"""
+
+import sys
+
+from aoc.runner import discover_days, load_solver
+
+
+def iter_lines(source):
+    """
+    Yield the lines of ``source`` without trailing newline, skipping empty
+    lines. ``source`` can be a path, an open file or any iterable of strings.
+    """
+    if isinstance(source, str):
+        with open(source) as f:
+            yield from iter_lines(f)
+        return
+    for line in source:
+        line = line.rstrip("\n")
+        if line:
+            yield line
+
+
+def solve_file(day, path):
+    module = load_solver(day, discover_days()[day])
+    if not hasattr(module, "solve_stream"):
+        raise ValueError(f"day {day} has no streaming solver")
+    return module.solve_stream(iter_lines(path))
+
+
+if __name__ == "__main__":
+    part1, part2 = solve_file(int(sys.argv[1]), sys.argv[2])
+    print("Part 1: {}".format(part1))
+    print("Part 2: {}".format(part2))
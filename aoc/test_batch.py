@@ -0,0 +1,76 @@
+import json
+
+from aoc import batch
+from aoc.batch import find_inputs, init_worker, run_batch, solve_input, write_results
+from aoc.generators import generate
+from aoc.runner import discover_days, load_solver
+
+
+def make_inputs(tmp_path, day, n):
+    for seed in range(n):
+        (tmp_path / f"input_{seed}.txt").write_text(generate(day, 200, seed=seed))
+    (tmp_path / "notes.md").write_text("not an input")
+    return str(tmp_path)
+
+
+def expected_answers(day, path):
+    module = load_solver(day, discover_days()[day])
+    with open(path) as f:
+        data = module.parse(f.read().strip())
+    return {"solve1": str(module.solve1(data)), "solve2": str(module.solve2(data))}
+
+
+def test_find_inputs(tmp_path):
+    make_inputs(tmp_path, 1, 3)
+    assert [p.rsplit("/", 1)[1] for p in find_inputs(str(tmp_path))] == [
+        "input_0.txt", "input_1.txt", "input_2.txt"
+    ]
+
+
+def test_run_batch(tmp_path):
+    directory = make_inputs(tmp_path, 2, 3)
+    results = run_batch(2, directory, jobs=1)
+    assert [r["input"] for r in results] == find_inputs(directory)
+    for result in results:
+        assert result["error"] is None
+        assert result["answers"] == expected_answers(2, result["input"])
+    # worker processes give the same answers
+    assert [r["answers"] for r in run_batch(2, directory, jobs=2)] == [
+        r["answers"] for r in results
+    ]
+
+
+def test_caches_cleared(tmp_path, monkeypatch):
+    directory = make_inputs(tmp_path, 17, 1)
+    monkeypatch.setattr(batch, "_solver", None)
+    monkeypatch.chdir(tmp_path)
+    init_worker(17, discover_days()[17])
+    result = solve_input(find_inputs(directory)[0])
+    assert result["error"] is None
+    # search is memoized on the target area of the input
+    assert batch._solver.search.cache_info().currsize == 0
+
+
+def test_shared_caches_kept(tmp_path, monkeypatch):
+    directory = make_inputs(tmp_path, 21, 1)
+    monkeypatch.setattr(batch, "_solver", None)
+    monkeypatch.chdir(tmp_path)
+    init_worker(21, discover_days()[21])
+    assert solve_input(find_inputs(directory)[0])["error"] is None
+    # the games from any starting position don't depend on the input
+    assert batch._solver.number_of_games_win.cache_info().currsize > 0
+
+
+def test_run_batch_cache_and_errors(tmp_path):
+    directory = make_inputs(tmp_path, 1, 2)
+    (tmp_path / "input_broken.txt").write_text("not a number\n")
+    cache_dir = str(tmp_path / "cache")
+    results = run_batch(1, directory, jobs=1, cache_dir=cache_dir)
+    assert [r["error"] is None for r in results] == [True, True, False]
+    again = run_batch(1, directory, jobs=1, cache_dir=cache_dir)
+    assert [r["cached"] for r in again] == [True, True, False]
+    assert [r["answers"] for r in again[:2]] == [r["answers"] for r in results[:2]]
+
+    output = tmp_path / "results.json"
+    write_results(str(output), 1, results)
+    assert json.loads(output.read_text())["results"][0]["answers"] == results[0]["answers"]
@@ -0,0 +1,24 @@
+from aoc.benchmark import percentile, compare, time_function
+
+
+def test_percentile():
+    assert percentile([3, 1, 2], 0.5) == 2
+    assert percentile([1, 2, 3, 4], 0.5) == 2.5
+    assert percentile(list(range(101)), 0.95) == 95
+
+
+def test_time_function():
+    times = time_function(sum, lambda: ([1, 2, 3],), repeat=4, warmup=1)
+    assert len(times) == 4
+
+
+def test_compare():
+    baseline = {"day01.solve1": {"median": 10_000_000}, "day01.solve2": {"median": 10_000_000}}
+    results = {
+        "day01.solve1": {"median": 11_000_000},
+        "day01.solve2": {"median": 20_000_000},
+        "day02.solve1": {"median": 20_000_000},
+    }
+    [(key, old, new, change)] = compare(results, baseline, threshold=0.2)
+    assert key == "day01.solve2"
+    assert change == 1.0
@@ -0,0 +1,45 @@
+import inspect
+import os
+
+from aoc import cache as cache_module
+from aoc.cache import ResultCache, aoc_imports, make_key
+from aoc.runner import discover_days, load_solver
+
+
+def test_make_key():
+    key = make_key("1\n2", cache_module, "solve1")
+    assert key == make_key(b"1\n2", cache_module, "solve1")
+    assert key != make_key("1\n3", cache_module, "solve1")
+    assert key != make_key("1\n2", cache_module, "solve2")
+
+
+def test_key_includes_aoc_modules(monkeypatch):
+    module = load_solver(3, discover_days()[3])
+    assert aoc_imports(inspect.getsource(module)) == {"aoc.grid", "aoc.timing"}
+    key = make_key("1\n2", module, "solve1")
+    getsource = inspect.getsource
+    monkeypatch.setattr(
+        inspect, "getsource", lambda m: getsource(m) + ("#\n" if m.__name__ == "aoc.grid" else "")
+    )
+    assert make_key("1\n2", module, "solve1") != key
+
+
+def test_get_set(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    assert cache.get("abc") is None
+    cache.set("abc", "1234")
+    assert cache.get("abc") == "1234"
+    assert ResultCache(str(tmp_path)).get("abc") == "1234"
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=100)
+    for i, key in enumerate("abc"):
+        cache.set(key, "x" * 20)
+        os.utime(os.path.join(str(tmp_path), f"{key}.json"), ns=(i, i))
+    # reading "a" makes it the most recently used entry
+    assert cache.get("a") is not None
+    cache.set("d", "x" * 20)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("d") is not None
@@ -0,0 +1,48 @@
+import pytest
+
+from aoc.generators import GENERATORS, generate, octopus_sync_step
+from aoc.runner import discover_days, load_solver
+
+
+def test_all_days():
+    assert sorted(GENERATORS) == list(range(1, 26))
+
+
+def test_deterministic():
+    assert generate(1, 100, seed=1) == generate(1, 100, seed=1)
+    assert generate(1, 100, seed=1) != generate(1, 100, seed=2)
+
+
+@pytest.mark.parametrize("day", range(1, 26))
+def test_parse(day):
+    module = load_solver(day, discover_days()[day])
+    assert module.parse(generate(day, 6)) is not None
+
+
+# 17, 19 and 23 take seconds even on small inputs and random sea floors
+# (25) can keep moving forever
+@pytest.mark.parametrize("day", [day for day in range(1, 26) if day not in (17, 19, 23, 25)])
+def test_solve(day):
+    module = load_solver(day, discover_days()[day])
+    raw_data = generate(day, 6, seed=1)
+    assert module.solve1(module.parse(raw_data)) is not None
+    assert module.solve2(module.parse(raw_data)) is not None
+
+
+@pytest.mark.parametrize("size", [10, 30])
+def test_octopuses_synchronize(size):
+    module = load_solver(11, discover_days()[11])
+    for seed in range(3):
+        raw_data = generate(11, size, seed=seed)
+        step = octopus_sync_step([int(c) for c in raw_data.replace("\n", "")], size, 1000)
+        assert step is not None
+        assert module.solve2(module.parse(raw_data)) == step
+
+
+def test_sizes():
+    assert len(generate(1, 1000).split("\n")) == 1000
+    assert len(generate(3, 5000).split("\n")) == 5000
+    assert len(generate(4, 7).split("\n\n")) == 8
+    grid = generate(9, 30).split("\n")
+    assert len(grid) == 30 and all(len(line) == 30 for line in grid)
+    assert generate(19, 4).count("scanner") == 4
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from aoc.grid import map_file, parse_grid, to_digits
+
+
+def test_parse_grid():
+    grid = parse_grid("\n123\n456\n")
+    assert grid.dtype == np.uint8
+    assert to_digits(grid).tolist() == [[1, 2, 3], [4, 5, 6]]
+    assert parse_grid(b"ab").tolist() == [[97, 98]]
+
+
+def test_not_rectangular():
+    with pytest.raises(ValueError):
+        parse_grid("123\n45\n6")
+
+
+def test_map_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"v>.\n..v\n")
+    grid = parse_grid(map_file(str(path)))
+    assert grid.shape == (2, 3)
+    assert bytes(grid[1]) == b"..v"
+    assert not grid.flags.writeable
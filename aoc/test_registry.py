@@ -0,0 +1,26 @@
+import sys
+
+from aoc.registry import solvers, import_times
+
+
+def test_solvers():
+    infos = solvers()
+    assert sorted(infos) == list(range(1, 26))
+    assert infos[1].measured[:4] == ["parse", "solve1", "solve2", "solve2_alternative"]
+    assert infos[1].has_stream
+    assert "numpy" not in infos[10].imports
+    assert "numpy" in infos[1].eager_imports
+    # lazy imports are listed, too
+    assert "networkx" in infos[15].imports
+    assert "networkx" not in infos[15].eager_imports
+
+
+def test_scan_does_not_import():
+    solvers()
+    assert "day15_solver" not in sys.modules
+
+
+def test_import_times():
+    total_us, modules = import_times(5)
+    assert total_us > 0
+    assert modules[0][0] == "numpy"
@@ -0,0 +1,37 @@
+from aoc.runner import discover_days, schedule, run_day
+
+
+def test_discover_days():
+    days = discover_days()
+    assert 1 in days
+    assert days[1].endswith("day01")
+
+
+def test_schedule():
+    timings = {1: 10, 2: 500, 3: 20}
+    assert schedule([1, 2, 3, 4], timings) == [4, 2, 3, 1]
+
+
+def test_run_day():
+    result = run_day(1, discover_days()[1])
+    assert result["error"] is None
+    assert set(result["answers"]) == {"solve1", "solve2"}
+    assert set(result["times"]) >= {"parse", "solve1", "solve2"}
+
+
+def test_run_day_captures_output(tmp_path, capsys):
+    (tmp_path / "input.txt").write_text("1 2 3\n")
+    (tmp_path / "solver.py").write_text(
+        "def parse(raw_data):\n"
+        "    print('parsing')\n"
+        "    return list(map(int, raw_data.split()))\n"
+        "def solve1(data):\n"
+        "    print('debug output')\n"
+        "    return sum(data)\n"
+        "def solve2(data):\n"
+        "    return max(data)\n"
+    )
+    result = run_day(99, str(tmp_path))
+    assert result["error"] is None
+    assert result["answers"] == {"solve1": "6", "solve2": "3"}
+    assert capsys.readouterr().out == ""
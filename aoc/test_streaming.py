@@ -0,0 +1,11 @@
+import io
+
+from aoc.streaming import iter_lines
+
+
+def test_iter_lines(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n\n3\n")
+    assert list(iter_lines(str(path))) == ["1", "2", "3"]
+    assert list(iter_lines(io.StringIO("a\nb"))) == ["a", "b"]
+    assert list(iter_lines(["x\n", "y"])) == ["x", "y"]
@@ -0,0 +1,35 @@
+from aoc.timing import Recorder, format_ns, format_bytes
+
+
+def test_measure():
+    recorder = Recorder()
+
+    @recorder.measure
+    def solve1(data):
+        return sum(data)
+
+    assert solve1([1, 2, 3]) == 6
+    assert solve1([1]) == 1
+    [(name, stats)] = recorder.items()
+    assert name == "solve1"
+    assert stats.calls == 2
+    assert stats.min_wall_ns <= stats.max_wall_ns <= stats.wall_ns
+    assert stats.peak_mem is None
+
+
+def test_track_memory():
+    recorder = Recorder(track_memory=True)
+
+    @recorder.measure
+    def parse(n):
+        return list(range(n))
+
+    parse(100000)
+    [(name, stats)] = recorder.items()
+    assert stats.peak_mem > 100000
+
+
+def test_format():
+    assert format_ns(1500) == "1.500us"
+    assert format_ns(2_000_000_000) == "2.000s"
+    assert format_bytes(3 << 20) == "3.0MiB"
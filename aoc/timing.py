@@ -0,0 +1,170 @@
+"""
+Timing and profiling of the solver functions.
+
+Decorate ``parse``/``solve1``/``solve2`` with ``measure_time``; every call then
+adds its wall time and cpu time (``time.perf_counter_ns``/``time.process_time_ns``)
+to the per-function statistics of the global ``recorder``.
+
+Optional switches (also settable via environment variables):
+ - ``recorder.track_memory`` (``AOC_TRACK_MEMORY=1``): record the peak memory
+   allocated during each call with ``tracemalloc``. This slows down the
+   measured code considerably, so it is off by default.
+ - ``recorder.profile`` (``AOC_PROFILE=solve2``): run the named function under
+   ``cProfile`` and print the hottest entries after each call (or dump them to
+   ``AOC_PROFILE_OUTPUT`` if given).
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from functools import wraps
+
+
+class Stats:
+    "Aggregated statistics of all calls of one function"
+
+    __slots__ = ("calls", "wall_ns", "min_wall_ns", "max_wall_ns", "cpu_ns", "peak_mem")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_ns = 0
+        self.min_wall_ns = None
+        self.max_wall_ns = 0
+        self.cpu_ns = 0
+        self.peak_mem = None
+
+    def add(self, wall_ns, cpu_ns, peak_mem=None):
+        self.calls += 1
+        self.wall_ns += wall_ns
+        self.cpu_ns += cpu_ns
+        if self.min_wall_ns is None or wall_ns < self.min_wall_ns:
+            self.min_wall_ns = wall_ns
+        self.max_wall_ns = max(self.max_wall_ns, wall_ns)
+        if peak_mem is not None:
+            self.peak_mem = max(self.peak_mem or 0, peak_mem)
+
+    @property
+    def mean_wall_ns(self):
+        return self.wall_ns / self.calls if self.calls else 0
+
+    def as_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
+class Recorder:
+    def __init__(self, track_memory=False, profile=None, profile_output=None):
+        self.stats = {}
+        self.track_memory = track_memory
+        self.profile = profile
+        self.profile_output = profile_output
+        self._depth = 0
+
+    def measure(self, func):
+        key = (func.__module__, func.__name__)
+
+        @wraps(func)
+        def _func(*args, **kwargs):
+            outermost = self._depth == 0
+            track_memory = self.track_memory and outermost
+            if track_memory:
+                started_tracing = not tracemalloc.is_tracing()
+                if started_tracing:
+                    tracemalloc.start()
+                tracemalloc.reset_peak()
+                mem_before = tracemalloc.get_traced_memory()[0]
+            profiler = cProfile.Profile() if self.profile == func.__name__ else None
+            self._depth += 1
+            try:
+                cpu_start = time.process_time_ns()
+                start = time.perf_counter_ns()
+                if profiler is not None:
+                    result = profiler.runcall(func, *args, **kwargs)
+                else:
+                    result = func(*args, **kwargs)
+                end = time.perf_counter_ns()
+                cpu_end = time.process_time_ns()
+            finally:
+                self._depth -= 1
+            peak_mem = None
+            if track_memory:
+                peak_mem = tracemalloc.get_traced_memory()[1] - mem_before
+                if started_tracing:
+                    tracemalloc.stop()
+            self.stats.setdefault(key, Stats()).add(end - start, cpu_end - cpu_start, peak_mem)
+            if profiler is not None:
+                self.dump_profile(profiler)
+            return result
+
+        return _func
+
+    def dump_profile(self, profiler):
+        if self.profile_output:
+            profiler.dump_stats(self.profile_output)
+        else:
+            pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
+
+    def reset(self):
+        self.stats.clear()
+
+    def items(self, module=None):
+        for (mod, name), stats in self.stats.items():
+            if module is None or mod == module:
+                yield name, stats
+
+    def report(self, module=None, file=None):
+        rows = list(self.items(module))
+        print("\nTime taken:", file=file)
+        print(
+            f"{'':20}{'calls':>6}{'total':>12}{'mean':>12}{'min':>12}{'max':>12}{'cpu':>12}"
+            + (f"{'peak mem':>12}" if self.track_memory else ""),
+            file=file,
+        )
+        for name, stats in rows:
+            line = f"{name:20}{stats.calls:>6}" + "".join(
+                f"{format_ns(ns):>12}"
+                for ns in (
+                    stats.wall_ns,
+                    stats.mean_wall_ns,
+                    stats.min_wall_ns,
+                    stats.max_wall_ns,
+                    stats.cpu_ns,
+                )
+            )
+            if self.track_memory:
+                line += f"{format_bytes(stats.peak_mem):>12}"
+            print(line, file=file)
+        print("----------------", file=file)
+        print(f"{'total':26}{format_ns(sum(s.wall_ns for _, s in rows)):>12}", file=file)
+
+
+def format_ns(ns):
+    if ns is None:
+        return "-"
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.3f}{unit}"
+    return f"{ns:.0f}ns"
+
+
+def format_bytes(n):
+    if n is None:
+        return "-"
+    for unit, scale in (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if n >= scale:
+            return f"{n / scale:.1f}{unit}"
+    return f"{n}B"
+
+
+recorder = Recorder(
+    track_memory=os.environ.get("AOC_TRACK_MEMORY", "") not in ("", "0"),
+    profile=os.environ.get("AOC_PROFILE") or None,
+    profile_output=os.environ.get("AOC_PROFILE_OUTPUT") or None,
+)
+measure_time = recorder.measure
+
+
+def print_report(module="__main__", file=None):
+    recorder.report(module=module, file=file)
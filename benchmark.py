@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+import logging
+import os
+import sys
+from argparse import ArgumentParser
+
+from aoc.benchmark import benchmark, compare, load_baseline, save_baseline, scaling
+from aoc.runner import ROOT, discover_days
+from aoc.timing import format_ns
+
+logging.basicConfig(
+    level=logging.INFO, format="%(levelname)-8s %(funcName)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("-d", "--day", dest="days", type=int, nargs="+", help="default: all days")
+    parser.add_argument("-n", "--repeat", default=5, type=int)
+    parser.add_argument("-w", "--warmup", default=1, type=int)
+    parser.add_argument("--max-time", default=10, type=float, help="stop repeating a function after this many seconds")
+    parser.add_argument("--baseline", default=os.path.join(ROOT, ".benchmark_baseline.json"))
+    parser.add_argument("--save", action="store_true", help="store the results as new baseline")
+    parser.add_argument("--threshold", default=0.2, type=float, help="allowed relative slowdown of the median")
+    parser.add_argument("--scale", type=float, nargs="+", help="benchmark on synthetic inputs of these multiples of the default size")
+    args = parser.parse_args()
+    kwargs = dict(repeat=args.repeat, warmup=args.warmup, max_time=args.max_time)
+
+    if args.scale:
+        for day in args.days or sorted(discover_days()):
+            for name, (points, exponent) in scaling(day, args.scale, **kwargs).items():
+                growth = f"~n^{exponent:.2f}" if exponent is not None else ""
+                print(
+                    f"day{day:02d}.{name:24}"
+                    + "".join(f"{f'x{factor:g}: ' + format_ns(median):>20}" for factor, median in points)
+                    + f"  {growth}"
+                )
+        sys.exit(0)
+
+    results = benchmark(days=args.days, **kwargs)
+    baseline = load_baseline(args.baseline)
+    print(f"{'':30}{'runs':>6}{'median':>12}{'p95':>12}{'baseline':>12}{'change':>9}")
+    for key, summary in results.items():
+        old = baseline.get(key, {}).get("median")
+        change = f"{summary['median'] / old - 1:+.0%}" if old else ""
+        print(
+            f"{key:30}{summary['runs']:>6}{format_ns(summary['median']):>12}"
+            f"{format_ns(summary['p95']):>12}{format_ns(old):>12}{change:>9}"
+        )
+
+    regressions = compare(results, baseline, threshold=args.threshold)
+    if args.save:
+        save_baseline(args.baseline, results)
+        logger.info(f"saved baseline to {args.baseline}")
+    if regressions:
+        for key, old, new, change in regressions:
+            logger.error(f"{key} got slower: {format_ns(old)} -> {format_ns(new)} ({change:+.0%})")
+        sys.exit(1)
@@ -0,0 +1,57 @@
+"""
+Shared pytest setup for all days, so that the test suites of all days can
+run in one session (optionally in parallel with pytest-xdist, ``-n auto``).
+
+ - tests of slow solvers are marked with ``@pytest.mark.slow``; skip them
+   with ``-m "not slow"``
+ - every test runs inside the directory of its day, like with
+   ``cd dayXX; pytest`` (some solvers read or write files there)
+ - ``solve_cached`` reuses the answers of (slow) solve functions from the
+   pytest cache as long as neither the test input nor the source of the
+   solver (or of the ``aoc`` modules it imports) changed
+"""
+
+import sys
+
+import pytest
+
+from aoc.cache import make_key
+
+
+# the templates are copied to new days by init.py, they aren't a test suite
+collect_ignore = ["templates"]
+
+
+@pytest.fixture(autouse=True)
+def day_directory(request, monkeypatch):
+    monkeypatch.chdir(request.path.parent)
+
+
+@pytest.fixture
+def solve_cached(request):
+    """
+    ``solve_cached(solve, data, *args)`` returns ``solve(data, *args)``, from
+    the pytest cache if this function already ran on the same test data with
+    the same solver source (always runs it without the cache, e.g. with
+    ``-p no:cacheprovider``)
+    """
+    cache = getattr(request.config, "cache", None)
+
+    def _solve(solve, data, *args):
+        module = sys.modules[solve.__module__]
+        raw_data = getattr(request.module, "TESTDATA", None)
+        if raw_data is None or cache is None:
+            return solve(data, *args)
+        key = make_key(f"{raw_data}{args!r}", module, solve.__name__)
+        path = f"aoc/{solve.__module__}/{solve.__name__}/{key}"
+        cached = cache.get(path, None)
+        if cached is not None:
+            return cached
+        result = solve(data, *args)
+        if hasattr(result, "item"):
+            # numpy scalar, store as python number
+            result = result.item()
+        cache.set(path, result)
+        return result
+
+    return _solve
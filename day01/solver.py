@@ -1,49 +1,45 @@
-from functools import wraps
-from datetime import datetime
+import os
+import sys
 
-times = []
+import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
 
-    return _func
+def parse_depths(text):
+    "Whitespace separated depths as an int64 array (ValueError for anything else)"
+    return np.array(text.split(), dtype=np.int64)
 
 
 @measure_time
 def parse(raw_data):
-    return [int(i) for i in raw_data.split("\n")]
+    return parse_depths(raw_data)
+
+
+def count_increases(depths, window=1, start=0):
+    """
+    Number of sliding windows of ``window`` depths whose sum is larger than
+    the one of the window before. Two consecutive windows share all but
+    their first and last depth, so this is just ``a[i + window] > a[i]``.
+    Only windows ending at index ``start`` or later are counted.
+    """
+    start = max(start, window)
+    if start >= len(depths):
+        return 0
+    return int(np.count_nonzero(depths[start:] > depths[start - window:len(depths) - window]))
 
 
 # PART 1
 @measure_time
 def solve1(data):
-    n = 0
-    for i in range(1, len(data)):
-        if data[i] > data[i - 1]:
-            n += 1
-    return n
+    return count_increases(data)
 
 
 # PART 2
 @measure_time
 def solve2(data):
-    windows = []
-    n = 0
-    for i in range(2, len(data)):
-        windows.append(data[i - 2] + data[i - 1] + data[i])
-        try:
-            if windows[-2] < windows[-1]:
-                n += 1
-        except IndexError:
-            pass
-    return n
+    return count_increases(data, 3)
 
 
 @measure_time
@@ -53,6 +49,122 @@ def solve2_alternative(data):
     return sum(a < b for a, b in zip(windows, windows[1:]))
 
 
+class DepthCounter:
+    """
+    Counts the increases of both parts for a live feed of depths. Only the
+    last ``window`` depths are kept, in a ring buffer, so adding a depth is
+    O(1) no matter how long the feed has been running.
+
+        counter = DepthCounter()
+        counter.add(199)
+        counter.extend([200, 208, 210])
+        counter.increases  # (3, 1)
+    """
+
+    __slots__ = ("window", "ring", "pos", "seen", "n1", "n2")
+
+    def __init__(self, window=3):
+        self.window = window
+        self.ring = [0] * window
+        self.pos = 0  # where the next depth goes, i.e. the oldest once the ring is full
+        self.seen = 0
+        self.n1 = self.n2 = 0
+
+    @property
+    def increases(self):
+        return self.n1, self.n2
+
+    def recent(self):
+        "The last (up to) ``window`` depths, oldest first"
+        if self.seen < self.window:
+            return self.ring[:self.seen]
+        return self.ring[self.pos:] + self.ring[:self.pos]
+
+    def add(self, depth):
+        if self.seen:
+            self.n1 += depth > self.ring[self.pos - 1]
+            if self.seen >= self.window:
+                self.n2 += depth > self.ring[self.pos]
+        self.ring[self.pos] = depth
+        self.pos = (self.pos + 1) % self.window
+        self.seen += 1
+
+    def extend(self, depths):
+        "Add a batch of depths at once (vectorized)"
+        depths = np.asarray(depths, dtype=np.int64)
+        history = self.recent()
+        combined = np.concatenate([np.array(history, dtype=np.int64), depths])
+        self.n1 += count_increases(combined, 1, start=len(history))
+        self.n2 += count_increases(combined, self.window, start=len(history))
+        last = combined[-self.window:].tolist()
+        self.ring = last + [0] * (self.window - len(last))
+        self.pos = len(last) % self.window
+        self.seen += len(depths)
+
+    def snapshot(self):
+        "State as a JSON serializable dict, see ``restore``"
+        return {
+            "window": self.window,
+            "recent": self.recent(),
+            "seen": self.seen,
+            "increases": [self.n1, self.n2],
+        }
+
+    @classmethod
+    def restore(cls, state):
+        counter = cls(state["window"])
+        recent = list(state["recent"])
+        counter.ring = recent + [0] * (counter.window - len(recent))
+        counter.pos = len(recent) % counter.window
+        counter.seen = state["seen"]
+        counter.n1, counter.n2 = state["increases"]
+        return counter
+
+
+@measure_time
+def solve_stream(lines, window=3):
+    """
+    Both parts in one pass over an iterable of lines, only keeping the last
+    ``window`` depths. Comparing the sums of two consecutive windows is the
+    same as comparing the depth leaving the window with the one entering it.
+    """
+    counter = DepthCounter(window)
+    for line in lines:
+        counter.add(int(line))
+    return counter.increases
+
+
+def read_chunks(f, chunk_size):
+    "Depths from a binary file in arrays of about ``chunk_size`` bytes"
+    rest = b""
+    while chunk := f.read(chunk_size):
+        chunk = rest + chunk
+        cut = chunk.rfind(b"\n") + 1
+        rest = chunk[cut:]
+        yield parse_depths(chunk[:cut].decode())
+    if rest.strip():
+        yield parse_depths(rest.decode())
+
+
+@measure_time
+def count_increases_file(path, windows=(1, 3), chunk_size=1 << 26):
+    """
+    ``count_increases`` for each of ``windows`` on a file that doesn't need
+    to fit in memory. The file is read in chunks; the last ``max(windows)``
+    depths of a chunk are carried over to compare with the next one.
+    """
+    carry = max(windows)
+    counts = [0] * len(windows)
+    tail = np.zeros(0, dtype=np.int64)
+    with open(path, "rb") as f:
+        for chunk in read_chunks(f, chunk_size):
+            depths = np.concatenate([tail, chunk])
+            for i, window in enumerate(windows):
+                counts[i] += count_increases(depths, window, start=len(tail))
+            tail = depths[-carry:]
+    return tuple(counts)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -61,8 +173,4 @@ if __name__ == "__main__":
     print("Part 2: {}".format(solve2(data)))
     print("Part 2: {}".format(solve2_alternative(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,9 @@
+import json
+
 import pytest
-from solver import parse, solve1, solve2
+from .solver import (
+    parse, solve1, solve2, solve_stream, count_increases, count_increases_file, DepthCounter
+)
 
 TESTDATA = """199
 200
@@ -32,3 +36,63 @@ def test_solve1(parsed_data):
 def test_solve2(parsed_data):
     solution = solve2(parsed_data)
     assert solution == 5
+
+
+def test_solve_stream():
+    assert solve_stream(iter(TESTDATA.split("\n"))) == (7, 5)
+
+
+def test_count_increases(parsed_data):
+    assert count_increases(parsed_data, 1) == 7
+    assert count_increases(parsed_data, 3) == 5
+    # windows as long as the data have nothing to compare
+    assert count_increases(parsed_data, 10) == 0
+    windows = [parsed_data[i:i + 4].sum() for i in range(len(parsed_data) - 3)]
+    assert count_increases(parsed_data, 4) == sum(a < b for a, b in zip(windows, windows[1:]))
+
+
+def test_count_increases_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text(TESTDATA + "\n")
+    # chunks that cut through lines and windows
+    for chunk_size in (1, 5, 7, 1000):
+        assert count_increases_file(str(path), (1, 3, 4), chunk_size) == (7, 5, 6)
+
+
+def test_depth_counter(parsed_data):
+    counter = DepthCounter()
+    for depth in parsed_data[:4]:
+        counter.add(int(depth))
+    assert counter.increases == (3, 1)
+    counter.extend(parsed_data[4:6])
+    counter.extend([])
+    counter.extend(parsed_data[6:])
+    assert counter.increases == (7, 5)
+    assert counter.recent() == [269, 260, 263]
+
+    # batches shorter than the window, one by one and all at once agree
+    for window in (1, 3, 4):
+        batched = DepthCounter(window)
+        for i in range(0, len(parsed_data), 2):
+            batched.extend(parsed_data[i:i + 2])
+        single = DepthCounter(window)
+        for depth in parsed_data:
+            single.add(int(depth))
+        assert batched.increases == single.increases == (
+            count_increases(parsed_data, 1), count_increases(parsed_data, window)
+        )
+
+
+def test_depth_counter_snapshot(parsed_data):
+    counter = DepthCounter()
+    counter.extend(parsed_data[:5])
+    state = json.loads(json.dumps(counter.snapshot()))
+    restored = DepthCounter.restore(state)
+    for c in (counter, restored):
+        for depth in parsed_data[5:]:
+            c.add(int(depth))
+    assert restored.increases == counter.increases == (7, 5)
+    # restoring before the ring is full
+    counter = DepthCounter.restore(DepthCounter(3).snapshot())
+    counter.extend(parsed_data)
+    assert counter.increases == (7, 5)
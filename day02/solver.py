@@ -1,64 +1,158 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 
+import numpy as np
 
-times = []
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
 
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
+def parse_line(line):
+    instruction, value = line.split()
+    return instruction, int(value)
 
-    return _func
+
+FORWARD, DOWN, UP = range(3)
+OPCODES = {"forward": FORWARD, "down": DOWN, "up": UP}
+
+
+# compact encoding of a command: 1 byte opcode + 4 byte value, no padding
+RECORD = np.dtype([("op", np.uint8), ("value", "<i4")])
+
+
+def encode(raw_data):
+    "Commands of the text format as an array of RECORDs (5 bytes per command)"
+    tokens = raw_data.split()
+    names = np.array(tokens[0::2])
+    ops = np.select(
+        [names == name for name in OPCODES], list(OPCODES.values()), 255
+    )
+    if (ops == 255).any():
+        raise ValueError(f"unknown instruction {names[ops == 255][0]!r}")
+    values = np.array(tokens[1::2], dtype=np.int64)
+    if len(values) and (values.min() < -2**31 or values.max() >= 2**31):
+        raise ValueError("command values have to fit in 32 bits")
+    commands = np.empty(len(ops), dtype=RECORD)
+    commands["op"] = ops
+    commands["value"] = values
+    return commands
 
 
 @measure_time
 def parse(raw_data):
-    out = []
-    for line in raw_data.split("\n"):
-        instruction, value = line.split()
-        value = int(value)
-        out.append((instruction, value))
-    return out
+    return encode(raw_data)
+
+
+def convert(text_path, binary_path, lines_per_chunk=1 << 20):
+    """
+    Convert a course file from the text format to the binary one (the raw
+    RECORDs), without reading the whole text file at once
+    """
+    with open(text_path) as text, open(binary_path, "wb") as binary:
+        while lines := list(islice(text, lines_per_chunk)):
+            encode("".join(lines)).tofile(binary)
+
+
+def load(binary_path):
+    "Memory map a converted course file, solve1/solve2 can run on it directly"
+    if os.path.getsize(binary_path) == 0:
+        return np.empty(0, dtype=RECORD)
+    return np.memmap(binary_path, dtype=RECORD, mode="r")
+
+
+def chunk_summary(ops, values):
+    """
+    (forward distance, change of aim, depth gained) of a block of commands
+    when starting with aim 0. The aim before each command is a cumulative
+    sum, so this needs no python loop. The depth is bounded by (n * max
+    value) ** 2; if that doesn't fit in int64, the same computation runs on
+    python ints (object arrays) instead of overflowing silently.
+    """
+    if len(values) == 0:
+        return 0, 0, 0
+    largest = max(abs(int(values.min())), abs(int(values.max())))
+    dtype = np.int64 if (len(values) * largest) ** 2 < 2**63 else object
+    values = values.astype(dtype)
+    forward = np.where(ops == FORWARD, values, 0).astype(dtype)
+    aim = np.cumsum((np.where(ops == DOWN, values, 0) - np.where(ops == UP, values, 0)).astype(dtype))
+    return int(forward.sum()), int(aim[-1]), int(np.dot(aim, forward))
+
+
+def combine(summaries):
+    """
+    Merge the summaries of consecutive blocks. Starting a block with aim a
+    instead of 0 adds a times its forward distance to the depth, so blocks
+    compose like affine maps and can be computed independently.
+    """
+    pos = aim = depth = 0
+    for block_pos, block_aim, block_depth in summaries:
+        depth += block_depth + aim * block_pos
+        pos += block_pos
+        aim += block_aim
+    return pos, aim, depth
+
+
+def run_commands(commands, jobs=1, chunk_size=1 << 20):
+    """
+    Final (position, aim, depth) after all ``commands`` (an array of
+    RECORDs, e.g. from ``parse`` or ``load``). The commands are split
+    into blocks of ``chunk_size``, which are summarized in ``jobs`` worker
+    processes (None: all cores) and merged in order. With the plain
+    up/down commands of part 1, the depth is what part 2 calls the aim.
+    """
+    ops, values = commands["op"], commands["value"]
+    bounds = range(0, len(commands), chunk_size)
+    if jobs == 1 or len(bounds) <= 1:
+        summaries = [chunk_summary(ops[i:i + chunk_size], values[i:i + chunk_size]) for i in bounds]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            summaries = list(
+                executor.map(
+                    chunk_summary,
+                    (ops[i:i + chunk_size] for i in bounds),
+                    (values[i:i + chunk_size] for i in bounds),
+                )
+            )
+    return combine(summaries)
 
 
 # PART 1
 @measure_time
-def solve1(data):
-    depth = 0
-    pos = 0
-    for instruction, value in data:
-        if instruction == "forward":
-            pos += value
-        elif instruction == "down":
-            depth += value
-        elif instruction == "up":
-            depth -= value
+def solve1(data, jobs=1):
+    pos, depth, _ = run_commands(data, jobs=jobs)
     return depth * pos
 
 
 # PART 2
 @measure_time
-def solve2(data):
-    depth = 0
+def solve2(data, jobs=1):
+    pos, _, depth = run_commands(data, jobs=jobs)
+    return depth * pos
+
+
+@measure_time
+def solve_stream(lines):
+    "Both parts in one pass over an iterable of lines"
+    depth1 = 0
+    depth2 = 0
     pos = 0
     aim = 0
-    for instruction, value in data:
+    for line in lines:
+        instruction, value = parse_line(line)
         if instruction == "forward":
             pos += value
-            depth += aim * value
+            depth2 += aim * value
         elif instruction == "down":
+            depth1 += value
             aim += value
         elif instruction == "up":
+            depth1 -= value
             aim -= value
-    return depth * pos
+    return depth1 * pos, depth2 * pos
 
 
 if __name__ == "__main__":
@@ -68,8 +162,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,7 @@
 import pytest
-from solver import parse, solve1, solve2
+from .solver import (
+    parse, solve1, solve2, solve_stream, run_commands, chunk_summary, combine, convert, load, RECORD
+)
 
 TESTDATA = """forward 5
 down 5
@@ -15,7 +17,9 @@ def parsed_data():
 
 def test_parse():
     data = parse(TESTDATA)
-    # asserts go here
+    assert data.itemsize == 5
+    assert list(data["op"]) == [0, 1, 0, 2, 1, 0]
+    assert list(data["value"]) == [5, 5, 8, 3, 8, 2]
 
 
 # PART 1
@@ -28,3 +32,48 @@ def test_solve1(parsed_data):
 def test_solve2(parsed_data):
     solution = solve2(parsed_data)
     assert solution == 900
+
+
+def test_solve_stream():
+    assert solve_stream(iter(TESTDATA.split("\n"))) == (150, 900)
+
+
+def test_run_commands(parsed_data):
+    assert run_commands(parsed_data) == (15, 10, 60)
+    # splitting into blocks (also across processes) doesn't change anything
+    for chunk_size in (1, 2, 4):
+        assert run_commands(parsed_data, chunk_size=chunk_size) == (15, 10, 60)
+    assert run_commands(parsed_data, jobs=2, chunk_size=2) == (15, 10, 60)
+    assert combine([chunk_summary(parsed_data["op"], parsed_data["value"])]) == (15, 10, 60)
+
+
+def test_parse_unknown_instruction():
+    with pytest.raises(ValueError):
+        parse("forward 5\nbackward 3")
+
+
+def test_convert_and_load(tmp_path):
+    text_path, binary_path = tmp_path / "input.txt", tmp_path / "input.bin"
+    text_path.write_text(TESTDATA + "\n")
+    convert(str(text_path), str(binary_path), lines_per_chunk=4)
+    assert binary_path.stat().st_size == 6 * RECORD.itemsize
+    commands = load(str(binary_path))
+    assert solve1(commands) == 150
+    assert solve2(commands) == 900
+    # empty files can't be memory mapped, but work nonetheless
+    (tmp_path / "empty.bin").write_bytes(b"")
+    assert solve2(load(str(tmp_path / "empty.bin"))) == 0
+
+
+def test_large_values():
+    # the depth of part 2 is far beyond int64
+    lines = ["down 2147483647", "forward 2147483647"] * 5000
+    expected = solve_stream(lines)
+    data = parse("\n".join(lines))
+    assert (solve1(data), solve2(data)) == expected
+    assert run_commands(data, chunk_size=777)[2] * 5000 * 2147483647 == expected[1]
+
+
+def test_parse_out_of_range():
+    with pytest.raises(ValueError):
+        parse("forward 3000000000")
@@ -1,73 +1,201 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
-import math
+from array import array
+import os
+import sys
 
+import numpy as np
 
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import parse_grid, to_digits
+from aoc.timing import measure_time, print_report
 
 
 @measure_time
 def parse(raw_data):
-    return raw_data.split("\n")
+    "The report as a lines x bits matrix of 0/1 (uint8)"
+    bits = to_digits(parse_grid(raw_data))
+    if bits.size and bits.max() > 1:
+        raise ValueError("the report may only contain 0 and 1")
+    return bits
 
 
-def count_ones(data, pos):
-    return sum(line[pos] == "1" for line in data)
+def pack(bits):
+    "One uint64 per line (most significant bit first), for up to 64 bits"
+    n, width = bits.shape
+    if width > 64:
+        raise ValueError("lines with more than 64 bits can't be packed")
+    values = np.zeros(n, dtype=np.uint64)
+    for column in bits.T:
+        values = (values << np.uint64(1)) | column
+    return values
 
 
 # PART 1
 @measure_time
 def solve1(data):
-    gamma = []
-    epsilon = []
-    n = len(data[0])
-    for i in range(n):
-        total = count_ones(data, i)
-        if total > len(data) // 2:
-            gamma.append("1")
-            epsilon.append("0")
+    n, width = data.shape
+    ones = data.sum(axis=0, dtype=np.int64)
+    gamma = 0
+    for count in ones:
+        gamma = gamma * 2 + int(count > n // 2)
+    epsilon = gamma ^ ((1 << width) - 1)
+    return gamma * epsilon
+
+
+def find(values, width, keep_ones):
+    """
+    Rating with the bit criterion ``keep_ones(ones, zeros)`` (keep the lines
+    with a 1 at the current position if true). ``values`` have to be
+    sorted: the lines that are left always share a prefix, so they are a
+    contiguous range of ``values``, and where the next bit switches from 0
+    to 1 within that range is found with a binary search.
+    """
+    lo, hi = 0, len(values)
+    prefix = 0
+    for i in range(width):
+        bit = 1 << (width - 1 - i)
+        split = int(np.searchsorted(values, np.uint64(prefix | bit)))
+        ones, zeros = hi - split, split - lo
+        if ones == 0 or zeros == 0:
+            # only one choice left
+            keep = ones > 0
+        else:
+            keep = keep_ones(ones, zeros)
+        if keep:
+            prefix |= bit
+            lo = split
         else:
-            gamma.append("0")
-            epsilon.append("1")
-    return int("".join(gamma), 2) * int("".join(epsilon), 2)
+            hi = split
+        if hi - lo == 1:
+            return int(values[lo])
+    return prefix
 
 
-def find(data, condition):
-    data = data[:]
-    for i in range(len(data[0])):
-        if condition(count_ones(data, i), math.ceil(len(data) / 2)):
-            data = [line for line in data if line[i] == "1"]
-        else:
-            data = [line for line in data if line[i] == "0"]
-        if len(data) == 1:
-            return int(data[0], 2)
+def most_common(ones, zeros):
+    return ones >= zeros
+
+
+def least_common(ones, zeros):
+    return ones < zeros
 
-def find_oxygen(data):
-    return find(data, lambda ones, half_n: ones >= half_n)
 
+def find_oxygen(values, width):
+    return find(values, width, most_common)
 
-def find_co2(data):
-    return find(data, lambda ones, half_n: ones < half_n)
+
+def find_co2(values, width):
+    return find(values, width, least_common)
 
 
 # PART 2
 @measure_time
 def solve2(data):
-    return find_oxygen(data) * find_co2(data)
+    values = np.sort(pack(data))
+    width = data.shape[1]
+    return find_oxygen(values, width) * find_co2(values, width)
+
+
+class BitTrie:
+    """
+    Binary prefix trie of report lines with the number of lines below each
+    node, for answering many rating queries on the same report in O(width)
+    each. Lines can be added and removed at any time; nodes whose count
+    drops to 0 stay allocated and are reused when a line comes back.
+
+        trie = BitTrie(5, [0b10110, 0b10111])
+        trie.find(most_common)  # oxygen rating
+    """
+
+    __slots__ = ("width", "children", "counts")
+
+    def __init__(self, width, values=()):
+        self.width = width
+        # node i has children children[2 * i] (0) and children[2 * i + 1] (1), 0 = none
+        self.children = array("q", [0, 0])
+        self.counts = array("q", [0])
+        for value in values:
+            self.insert(value)
+
+    def __len__(self):
+        return self.counts[0]
+
+    def insert(self, value):
+        node = 0
+        self.counts[0] += 1
+        for shift in range(self.width - 1, -1, -1):
+            slot = 2 * node + ((value >> shift) & 1)
+            if self.children[slot] == 0:
+                self.children[slot] = len(self.counts)
+                self.children.extend((0, 0))
+                self.counts.append(0)
+            node = self.children[slot]
+            self.counts[node] += 1
+
+    def remove(self, value):
+        path = [0]
+        for shift in range(self.width - 1, -1, -1):
+            node = self.children[2 * path[-1] + ((value >> shift) & 1)]
+            if node == 0 or self.counts[node] == 0:
+                raise KeyError(value)
+            path.append(node)
+        for node in path:
+            self.counts[node] -= 1
+
+    def count(self, node, bit):
+        child = self.children[2 * node + bit]
+        return self.counts[child] if child else 0
+
+    def find(self, keep_ones):
+        "Rating for the bit criterion ``keep_ones(ones, zeros)``, like ``find``"
+        if not len(self):
+            raise ValueError("the trie is empty")
+        node = value = 0
+        for _ in range(self.width):
+            ones, zeros = self.count(node, 1), self.count(node, 0)
+            if ones == 0 or zeros == 0:
+                bit = 1 if ones else 0
+            else:
+                bit = 1 if keep_ones(ones, zeros) else 0
+            value = value * 2 + bit
+            node = self.children[2 * node + bit]
+        return value
+
+
+@measure_time
+def solve2_trie(data):
+    trie = BitTrie(data.shape[1], pack(data).tolist())
+    return trie.find(most_common) * trie.find(least_common)
+
+
+@measure_time
+def solve_stream(lines):
+    """
+    Both parts in one pass over an iterable of lines, without keeping the
+    lines. Part 1 only needs the number of ones per column. The ratings of
+    part 2 need to know how many lines share each prefix, which a ``BitTrie``
+    stores with one node per distinct prefix: at most ``min(n * width,
+    2 ** (width + 1))`` nodes of 24 bytes, i.e. not constant, but bounded by
+    the number of bits for long reports (about 200 kB for 12 bits).
+    """
+    ones = None
+    trie = None
+    n = 0
+    for line in lines:
+        if trie is None:
+            width = len(line)
+            ones = [0] * width
+            trie = BitTrie(width)
+        for i, bit in enumerate(line):
+            if bit == "1":
+                ones[i] += 1
+        trie.insert(int(line, 2))
+        n += 1
+    gamma = 0
+    for count in ones:
+        gamma = gamma * 2 + (count > n // 2)
+    epsilon = gamma ^ ((1 << width) - 1)
+    return gamma * epsilon, trie.find(most_common) * trie.find(least_common)
 
 
 if __name__ == "__main__":
@@ -76,9 +204,6 @@ if __name__ == "__main__":
     data = parse(open("input.txt").read().strip())
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
+    print("Part 2: {}".format(solve2_trie(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,9 @@
+import numpy as np
 import pytest
-from solver import parse, solve1, solve2
+from .solver import (
+    parse, solve1, solve2, solve2_trie, solve_stream, pack, find_oxygen, find_co2,
+    BitTrie, find, most_common, least_common,
+)
 
 TESTDATA = """00100
 11110
@@ -21,7 +25,8 @@ def parsed_data():
 
 def test_parse():
     data = parse(TESTDATA)
-    # asserts go here
+    assert data.shape == (12, 5)
+    assert list(pack(data)[:3]) == [0b00100, 0b11110, 0b10110]
 
 
 # PART 1
@@ -34,3 +39,45 @@ def test_solve1(parsed_data):
 def test_solve2(parsed_data):
     solution = solve2(parsed_data)
     assert solution == 230
+    assert solve2_trie(parsed_data) == 230
+
+
+def test_solve_stream():
+    assert solve_stream(iter(TESTDATA.split("\n"))) == (198, 230)
+
+
+def test_find(parsed_data):
+    values = np.sort(pack(parsed_data))
+    assert find_oxygen(values, 5) == 23
+    assert find_co2(values, 5) == 10
+
+
+def test_64_bits():
+    lines = ["1" * 64, "0" * 63 + "1", "1" + "0" * 63]
+    data = parse("\n".join(lines))
+    assert list(pack(data)) == [int(line, 2) for line in lines]
+    values = np.sort(pack(data))
+    assert find_oxygen(values, 64) == 2**64 - 1
+    assert find_co2(values, 64) == 1
+
+
+def test_bit_trie(parsed_data):
+    values = pack(parsed_data).tolist()
+    trie = BitTrie(5, values)
+    assert len(trie) == 12
+    assert trie.find(most_common) == 23
+    assert trie.find(least_common) == 10
+    # any other criterion gives the same as the binary search
+    for keep_ones in (lambda ones, zeros: ones <= zeros, lambda ones, zeros: ones > 2 * zeros):
+        assert trie.find(keep_ones) == find(np.sort(values), 5, keep_ones)
+
+    # removing and adding lines again updates the answers
+    trie.remove(0b10111)
+    assert len(trie) == 11
+    remaining = np.sort([v for v in values if v != 0b10111])
+    assert trie.find(most_common) == find_oxygen(remaining, 5)
+    assert trie.find(least_common) == find_co2(remaining, 5)
+    trie.insert(0b10111)
+    assert trie.find(most_common) == 23
+    with pytest.raises(KeyError):
+        trie.remove(0b11111)
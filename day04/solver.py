@@ -1,99 +1,189 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
-
-
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
-
-
-class Board:
-    def __init__(self, data):
-        self.board = data
-        self.marked = [[False for x in data] for y in data]
-        self.done = False
-
-    def mark(self, i):
-        for y, row in enumerate(self.board):
-            for x, val in enumerate(row):
-                if val == i:
-                    self.marked[y][x] = True
-
-    def has_win(self):
-        if (
-            any(all([marked for marked in row]) for row in self.marked)
-            or any(all(row[x] for row in self.marked) for x in range(len(self.board)))
-        ):
-            return True
-        return False
-
-    @property
-    def score(self):
-        score = 0
-        for row, row_marked in zip(self.board, self.marked):
-            for val, marked in zip(row, row_marked):
-                if marked:
-                    continue
-                score += val
-        return score
+from array import array
+from collections import defaultdict
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
+
+
+class Deck:
+    """
+    The parsed boards, shared by any number of games. ``boards`` is a
+    read-only ``(n_boards, size, size)`` array and ``index`` maps every
+    number to the (flat) cells where it appears, so playing never scans the
+    boards.
+    """
+
+    __slots__ = ("boards", "size", "index")
+
+    def __init__(self, boards):
+        boards = np.array(boards, dtype=np.int64)
+        boards.setflags(write=False)
+        self.boards = boards
+        self.size = boards.shape[1] if boards.size else 0
+        index = defaultdict(list)
+        for cell, number in enumerate(boards.ravel().tolist()):
+            index[number].append(cell)
+        self.index = {number: tuple(cells) for number, cells in index.items()}
+
+    def __len__(self):
+        return len(self.boards)
 
     def __repr__(self):
-        return (
-            "\n".join([" ".join(str(i) for i in row) for row in self.board])
-            + "\n\n"
-            + "\n".join([" ".join("1" if i else "0" for i in row) for row in self.marked])
-            + "\n"
+        return "\n\n".join(
+            "\n".join(" ".join(f"{i:2}" for i in row) for row in board)
+            for board in self.boards.tolist()
         )
 
 
+class Game:
+    """
+    State of one game on a ``Deck``: hit counters for every row and column,
+    the running sum of unmarked numbers of every board and which boards have
+    won, all in flat arrays. Drawing a number only touches the cells where
+    it appears, so a win is detected (and scored) when it happens.
+    """
+
+    __slots__ = ("deck", "row_hits", "col_hits", "unmarked", "won", "drawn")
+
+    def __init__(self, deck):
+        self.deck = deck
+        n = len(deck) * deck.size
+        self.row_hits = array("H", bytes(2 * n))
+        self.col_hits = array("H", bytes(2 * n))
+        self.unmarked = array("q", deck.boards.sum(axis=(1, 2)).tolist())
+        self.won = bytearray(len(deck))
+        self.drawn = set()
+
+    def draw(self, number):
+        "Mark ``number``, return a list of (board, score) of the boards that won with it"
+        if number in self.drawn:
+            return []
+        self.drawn.add(number)
+        size = self.deck.size
+        winners = []
+        for cell in self.deck.index.get(number, ()):
+            b, rest = divmod(cell, size * size)
+            if self.won[b]:
+                continue
+            y, x = divmod(rest, size)
+            self.unmarked[b] -= number
+            row, col = b * size + y, b * size + x
+            self.row_hits[row] += 1
+            self.col_hits[col] += 1
+            if self.row_hits[row] == size or self.col_hits[col] == size:
+                self.won[b] = 1
+                winners.append((b, self.unmarked[b] * number))
+        return winners
+
+
+def play(sequence, deck):
+    "Yield (board, score) for the boards in the order they win"
+    game = Game(deck)
+    for number in sequence:
+        yield from game.draw(number)
+
+
+# memory budget of the per chunk (sequences, boards, cells) arrays in evaluate
+MAX_CHUNK_BYTES = 1 << 26
+
+
+def evaluate(deck, sequences, max_bytes=MAX_CHUNK_BYTES):
+    """
+    Scores of the first and the last winning board (0 if there is none) for
+    each of many draw ``sequences`` on the same deck, as an array of shape
+    ``(n_sequences, 2)``.
+
+    Instead of playing, every cell gets the time its number is drawn (its
+    rank in the sequence). A line is complete at the latest time of its
+    cells, a board wins at the earliest time of its lines, and all numbers
+    drawn later are unmarked. Ranks are int16 (int32 for sequences of 32k
+    numbers or more) and the sequences are evaluated in chunks whose
+    (sequences, boards, cells) ranks and masks fit in ``max_bytes``.
+    """
+    boards = deck.boards
+    n_boards = len(boards)
+    out = np.zeros((len(sequences), 2), dtype=np.int64)
+    if n_boards == 0 or len(sequences) == 0:
+        return out
+    max_number = int(max(boards.max(), max((max(seq, default=0) for seq in sequences), default=0)))
+    rank_type = np.int16 if max(len(seq) for seq in sequences) < np.iinfo(np.int16).max else np.int32
+    # ranks plus the boolean mask of unmarked cells
+    cell_bytes = n_boards * deck.size * deck.size * (np.dtype(rank_type).itemsize + 1)
+    chunk_size = max(1, max_bytes // cell_bytes)
+    for start in range(0, len(sequences), chunk_size):
+        chunk = sequences[start:start + chunk_size]
+        never = max(len(seq) for seq in chunk)
+        ranks = np.full((len(chunk), max_number + 1), never, dtype=rank_type)
+        drawn = np.zeros((len(chunk), never + 1), dtype=np.int64)
+        for i, seq in enumerate(chunk):
+            seq = np.asarray(seq, dtype=np.int64)
+            # the first occurrence of a number counts
+            numbers, first = np.unique(seq, return_index=True)
+            ranks[i, numbers] = first
+            drawn[i, :len(seq)] = seq
+        cell_ranks = ranks[:, boards]  # (sequences, boards, size, size)
+        win_time = np.minimum(cell_ranks.max(axis=3).min(axis=2), cell_ranks.max(axis=2).min(axis=2))
+        unmarked_cells = cell_ranks > win_time[:, :, None, None]
+        del cell_ranks
+        unmarked = np.sum(
+            np.broadcast_to(boards, unmarked_cells.shape), axis=(2, 3), where=unmarked_cells
+        )
+        del unmarked_cells
+        scores = unmarked * np.take_along_axis(drawn, win_time.astype(np.intp), axis=1)
+        has_winner = (win_time < never).any(axis=1)
+        # ties: within a draw, boards win in order
+        first = np.argmin(win_time, axis=1)
+        last_time = np.where(win_time < never, win_time, -1)
+        last = n_boards - 1 - np.argmax(last_time[:, ::-1], axis=1)
+        rows = np.arange(len(chunk))
+        out[start:start + len(chunk), 0] = np.where(has_winner, scores[rows, first], 0)
+        out[start:start + len(chunk), 1] = np.where(has_winner, scores[rows, last], 0)
+    return out
+
+
 @measure_time
 def parse(raw_data):
-    raw_data = raw_data.split("\n")
-    sequence = [int(i) for i in raw_data[0].split(",")]
-    boards = []
-    for data in "\n".join(raw_data[2:]).split("\n\n"):
-        boards.append(
-            Board([[int(i) for i in line.split()] for line in data.split("\n")])
-        )
-    return sequence, boards
+    "The draw sequence (tuple) and the ``Deck`` of boards"
+    first, _, rest = raw_data.partition("\n")
+    sequence = tuple(int(i) for i in first.split(","))
+    blocks = rest.strip().split("\n\n")
+    size = len(blocks[0].split("\n")) if rest.strip() else 0
+    numbers = np.array(rest.split(), dtype=np.int64)
+    return sequence, Deck(numbers.reshape(-1, size, size) if size else np.zeros((0, 0, 0)))
 
 
 # PART 1
 @measure_time
 def solve1(data):
-    sequence, boards = data
-    for i in sequence:
-        for board in boards:
-            board.mark(i)
-            if board.has_win():
-                return board.score * i
+    sequence, deck = data
+    for board, score in play(sequence, deck):
+        return score
 
 
 # PART 2
 @measure_time
 def solve2(data):
-    sequence, boards = data
-    for i in sequence:
-        for board in boards:
-            board.mark(i)
-            if board.has_win() and not board.done:
-                board.done = True
-                solution = board.score * i
+    sequence, deck = data
+    solution = None
+    for board, score in play(sequence, deck):
+        solution = score
     return solution
 
 
+@measure_time
+def solve_vectorized(data):
+    "Both parts at once with ``evaluate``"
+    sequence, deck = data
+    first, last = evaluate(deck, [sequence])[0]
+    return int(first), int(last)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -101,8 +191,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
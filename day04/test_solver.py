@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
-from solver import parse, solve1, solve2
+
+from .solver import parse, solve1, solve2, solve_vectorized, play, evaluate, Game
 
 TESTDATA = """7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1
 
@@ -28,23 +30,24 @@ def parsed_data():
 
 def test_parse():
     data = parse(TESTDATA)
-    sequence, boards = data
-    assert sequence == [7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1]
-    assert boards[0].board == [
+    sequence, deck = data
+    assert sequence == (7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,26,1)
+    assert len(deck) == 3
+    assert deck.boards[0].tolist() == [
         [22, 13, 17, 11, 0],
         [8, 2, 23, 4, 24],
         [21, 9, 14, 16, 7],
         [6, 10, 3, 18, 5],
         [1, 12, 20, 15, 19],
     ]
-    assert boards[1].board == [
+    assert deck.boards[1].tolist() == [
         [3, 15, 0, 2, 22],
         [9, 18, 13, 17, 5],
         [19, 8, 7, 25, 23],
         [20, 11, 10, 24, 4],
         [14, 21, 16, 12, 6],
     ]
-    assert boards[2].board == [
+    assert deck.boards[2].tolist() == [
         [14, 21, 17, 24, 4],
         [10, 16, 15, 9, 19],
         [18, 8, 23, 26, 20],
@@ -62,3 +65,43 @@ def test_solve1(parsed_data):
 def test_solve2(parsed_data):
     solution = solve2(parsed_data)
     assert solution == 1924
+
+
+def test_play(parsed_data):
+    # board 2 wins first (after 24), then board 0, board 1 last (after 13)
+    assert list(play(*parsed_data)) == [(2, 4512), (0, 2192), (1, 1924)]
+    # solving doesn't change the parsed data, it can be solved again
+    assert solve1(parsed_data) == 4512
+    assert solve2(parsed_data) == 1924
+    # the deck can't be modified by accident
+    with pytest.raises(ValueError):
+        parsed_data[1].boards[0, 0, 0] = 1
+
+
+def test_game(parsed_data):
+    sequence, deck = parsed_data
+    game = Game(deck)
+    winners = [game.draw(number) for number in sequence[:12]]
+    assert winners[-1] == [(2, 4512)]
+    assert not any(winners[:-1])
+    # drawing a number twice changes nothing
+    assert game.draw(24) == []
+    # a new game on the same deck starts from scratch
+    assert Game(deck).draw(24) == []
+
+
+def test_evaluate(parsed_data):
+    sequence, deck = parsed_data
+    assert solve_vectorized(parsed_data) == (4512, 1924)
+    rng = np.random.default_rng(0)
+    sequences = [sequence, sequence[:5]]
+    sequences += [tuple(rng.permutation(sequence).tolist()) for _ in range(20)]
+    # numbers drawn again later don't change anything
+    sequences += [tuple(rng.choice(sequence, 2 * len(sequence)).tolist()) for _ in range(5)]
+    # 3 boards of 25 int16 ranks and mask bytes: chunks of 13 sequences
+    scores = evaluate(deck, sequences, max_bytes=3000)
+    assert scores.tolist() == evaluate(deck, sequences).tolist()
+    assert scores[1].tolist() == [0, 0]
+    for seq, (first, last) in zip(sequences, scores.tolist()):
+        wins = [score for board, score in play(seq, deck)]
+        assert (first, last) == ((wins[0], wins[-1]) if wins else (0, 0))
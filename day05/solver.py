@@ -1,95 +1,395 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
+import bisect
+from collections import defaultdict
 import numpy as np
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
-times = []
 
+def parse_line(line):
+    start, end = line.split(" -> ")
+    x1, y1 = start.split(",")
+    x2, y2 = end.split(",")
+    return ((int(x1), int(y1)), (int(x2), int(y2)))
 
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
 
-    return _func
+@measure_time
+def parse(raw_data):
+    "Segments as an (n, 4) int64 array of x1, y1, x2, y2"
+    numbers = raw_data.replace(" -> ", ",").replace("\n", ",").split(",")
+    return np.array(numbers, dtype=np.int64).reshape(-1, 4)
 
 
-def parse_gen(raw_data):
-    for line in raw_data.split("\n"):
-        start, end = line.split(" -> ")
-        x1, y1 = start.split(",")
-        x2, y2 = end.split(",")
-        yield ((int(x1), int(y1)), (int(x2), int(y2)))
+def select_segments(segments, consider_diagonals=False):
+    """
+    Only horizontal and vertical segments, plus the 45 degree diagonals if
+    ``consider_diagonals``. Single points count as diagonals.
+    """
+    dx = segments[:, 2] - segments[:, 0]
+    dy = segments[:, 3] - segments[:, 1]
+    diagonal = np.abs(dx) == np.abs(dy)
+    if consider_diagonals:
+        return segments[diagonal | (dx == 0) | (dy == 0)]
+    return segments[~diagonal & ((dx == 0) | (dy == 0))]
 
 
-@measure_time
-def parse(raw_data):
-    return list(parse_gen(raw_data))
+def count_along(starts, ends, shape, axis=0):
+    """
+    Coverage of runs of cells along ``axis`` of a grid of ``shape``, from
+    the (flat) indices of their first cells and of the cells right after
+    their ends: +1/-1 markers summed along ``axis``. No cell is covered by
+    more runs than there are, so for up to 32767 runs everything is int16
+    (int32 otherwise). The markers are counted with ``np.unique``, the
+    unbuffered ``np.add.at`` is several times slower.
+    """
+    dtype = np.int16 if len(starts) <= np.iinfo(np.int16).max else np.int32
+    marks = np.zeros(shape[0] * shape[1], dtype=dtype)
+    for indices, sign in ((starts, 1), (ends, -1)):
+        indices, counts = np.unique(indices, return_counts=True)
+        marks[indices] += sign * counts.astype(dtype)
+    return np.cumsum(marks.reshape(shape), axis=axis, dtype=dtype)
+
+
+def add_saturated(covered, counts):
+    "Add ``counts`` to the uint8 grid ``covered``, saturating at 2"
+    covered += np.minimum(counts, 2).astype(np.uint8)
+    np.minimum(covered, 2, out=covered)
+
+
+def segment_pixels(segments):
+    "x and y of all pixels of (selected) segments, concatenated"
+    x1, y1, x2, y2 = segments.T
+    step_x, step_y = np.sign(x2 - x1), np.sign(y2 - y1)
+    lengths = np.maximum(np.abs(x2 - x1), np.abs(y2 - y1)) + 1
+    segment = np.repeat(np.arange(len(segments)), lengths)
+    # position of each pixel along its segment
+    t = np.arange(len(segment)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return x1[segment] + t * step_x[segment], y1[segment] + t * step_y[segment]
+
+
+def draw_pixels(covered, segments):
+    "Count every pixel of the segments into ``covered`` (short segments)"
+    xs, ys = segment_pixels(segments)
+    counts = np.bincount(ys * covered.shape[1] + xs, minlength=covered.size)
+    add_saturated(covered, counts.reshape(covered.shape))
+
+
+def draw_differences(covered, segments):
+    """
+    Count the segments into ``covered`` via difference grids (long segments):
+    each segment only marks its start and the pixel after its end, and a
+    cumulative sum along the direction of the segments fills in the rest.
+    Diagonals are summed on a skewed grid where they become columns.
+    """
+    h, w = covered.shape
+    cols = np.arange(w)
+    rows = np.arange(h)[:, None]
+    x1, y1, x2, y2 = segments.T
+    # point every segment in +x direction, vertical ones in +y direction
+    flip = (x2 < x1) | ((x2 == x1) & (y2 < y1))
+    x1, x2 = np.where(flip, x2, x1), np.where(flip, x1, x2)
+    y1, y2 = np.where(flip, y2, y1), np.where(flip, y1, y2)
+    horizontal = y1 == y2
+    vertical = (x1 == x2) & ~horizontal
+    falling = (y2 > y1) & ~vertical  # y grows with x
+    rising = (y2 < y1) & ~vertical
+
+    s = horizontal
+    if s.any():
+        counts = count_along(y1[s] * (w + 1) + x1[s], y1[s] * (w + 1) + x2[s] + 1, (h, w + 1), axis=1)
+        add_saturated(covered, counts[:, :w])
+    s = vertical
+    if s.any():
+        counts = count_along(y1[s] * w + x1[s], (y2[s] + 1) * w + x1[s], (h + 1, w))
+        add_saturated(covered, counts[:h])
+    # column x - y + h on the skewed grid
+    s = falling
+    if s.any():
+        skewed = count_along(
+            y1[s] * (w + h + 1) + x1[s] - y1[s] + h,
+            (y2[s] + 1) * (w + h + 1) + x1[s] - y1[s] + h,
+            (h + 1, w + h + 1),
+        )
+        add_saturated(covered, skewed[rows, cols - rows + h])
+        del skewed
+    # rising diagonals run from (x2, y2) down to (x1, y1), column x + y
+    s = rising
+    if s.any():
+        skewed = count_along(
+            y2[s] * (w + h) + x2[s] + y2[s], (y1[s] + 1) * (w + h) + x2[s] + y2[s], (h + 1, w + h)
+        )
+        add_saturated(covered, skewed[rows, cols + rows])
+
 
+def rasterize(segments, shape):
+    """
+    Number of segments covering each pixel, saturated at 2 (all we need to
+    know), as a uint8 grid of ``shape``.
 
-def make_vent_pixels(data):
-    return np.zeros(
-        (
-            max(max(y1, y2) for (x1, y1), (x2, y2) in data) + 1,
-            max(max(x1, x2)for (x1, y1), (x2, y2) in data) + 1,
-        ),
-        dtype=int
-    )
+    If the segments have fewer pixels than the grid, their pixels are
+    counted directly, otherwise through difference grids, which is
+    O(segments + pixels) no matter how long the segments are.
+    """
+    covered = np.zeros(shape, dtype=np.uint8)
+    lengths = np.abs(segments[:, 2:] - segments[:, :2]).max(axis=1) + 1
+    if lengths.sum() <= covered.size:
+        draw_pixels(covered, segments)
+    else:
+        draw_differences(covered, segments)
+    return covered
 
 
 class VentMap:
     def __init__(self, data, consider_diagonals=False):
-        self.map = make_vent_pixels(data)
+        segments = select_segments(data, consider_diagonals)
+        if len(segments):
+            shape = (segments[:, 1::2].max() + 1, segments[:, 0::2].max() + 1)
+        else:
+            shape = (0, 0)
+        self.map = rasterize(segments, shape)
+
+
+# lines through a pixel in each direction are identified by a * x + b * y,
+# positions along them by x (y for vertical lines)
+DIRECTIONS = {
+    "horizontal": (0, 1),
+    "vertical": (1, 0),
+    "falling": (1, -1),
+    "rising": (1, 1),
+}
+
+
+def line_key(direction, x, y):
+    a, b = DIRECTIONS[direction]
+    return a * x + b * y
+
+
+def line_pixel(direction, key, pos):
+    if direction == "horizontal":
+        return pos, key
+    if direction == "vertical":
+        return key, pos
+    if direction == "falling":
+        return pos, pos - key
+    return pos, key - pos
+
+
+def line_intervals(segments):
+    "direction -> line key -> list of (start, end) positions of the segments on it"
+    lines = {direction: defaultdict(list) for direction in DIRECTIONS}
+    for x1, y1, x2, y2 in segments.tolist():
+        if y1 == y2:
+            direction = "horizontal"
+        elif x1 == x2:
+            direction = "vertical"
+        elif x2 - x1 == y2 - y1:
+            direction = "falling"
+        else:
+            direction = "rising"
+        start, end = (y1, y2) if direction == "vertical" else (x1, x2)
+        lines[direction][line_key(direction, x1, y1)].append((min(start, end), max(start, end)))
+    return lines
+
+
+def coverage(intervals):
+    """
+    Sweep over the (inclusive) intervals on one line and return the merged
+    intervals covered at least once and at least twice
+    """
+    events = sorted([(start, 1) for start, end in intervals] + [(end + 1, -1) for start, end in intervals])
+    once, twice = [], []
+    depth = 0
+    prev = None
+    for pos, change in events:
+        if prev is not None and pos > prev:
+            for merged, level in ((once, 1), (twice, 2)):
+                if depth >= level:
+                    if merged and merged[-1][1] == prev - 1:
+                        merged[-1][1] = pos - 1
+                    else:
+                        merged.append([prev, pos - 1])
+        depth += change
+        prev = pos
+    return once, twice
+
+
+def crossings(dir_a, lines_a, dir_b, lines_b):
+    """
+    Pixels where an interval on a line of direction ``dir_a`` crosses one of
+    ``dir_b``. Seen along the lines of ``dir_b``, every interval of ``dir_a``
+    is active over a range of ``dir_b`` keys: a sweep over those keys with a
+    sorted list of active ``dir_a`` keys finds the crossings in
+    O((n + crossings) log n).
+    """
+    (aa, ba), (ab, bb) = DIRECTIONS[dir_a], DIRECTIONS[dir_b]
+    det = aa * bb - ba * ab
+    INSERT, QUERY, REMOVE = range(3)
+    events = []
+    for key_a, intervals in lines_a.items():
+        for start, end in intervals:
+            ends = sorted(line_key(dir_b, *line_pixel(dir_a, key_a, pos)) for pos in (start, end))
+            events.append((ends[0], INSERT, key_a))
+            events.append((ends[1], REMOVE, key_a))
+    for key_b, intervals in lines_b.items():
+        for start, end in intervals:
+            ends = sorted(line_key(dir_a, *line_pixel(dir_b, key_b, pos)) for pos in (start, end))
+            events.append((key_b, QUERY, ends))
+    events.sort(key=lambda event: event[:2])
+    active = []
+    for key_b, kind, value in events:
+        if kind == INSERT:
+            bisect.insort(active, value)
+        elif kind == REMOVE:
+            del active[bisect.bisect_left(active, value)]
+        else:
+            lo, hi = value
+            for key_a in active[bisect.bisect_left(active, lo):bisect.bisect_right(active, hi)]:
+                # solve a_a x + b_a y = key_a, a_b x + b_b y = key_b
+                x, x_rest = divmod(key_a * bb - ba * key_b, det)
+                y, y_rest = divmod(aa * key_b - ab * key_a, det)
+                # diagonals of different parity cross between pixels
+                if x_rest == 0 and y_rest == 0:
+                    yield x, y
+
+
+def count_overlaps_sparse(segments):
+    """
+    Number of pixels covered by at least 2 of the (selected) segments,
+    without a grid, so memory and time only depend on the number of
+    segments and crossings, not on the coordinates.
+
+    Each line is swept separately to find where segments on it overlap
+    (``coverage``). Pixels where lines of different directions cross are
+    collected in a set; those that also lie in an overlap of one of their
+    lines must only be counted once.
+    """
+    lines = line_intervals(segments)
+    covered = {direction: {} for direction in DIRECTIONS}
+    overlaps = {direction: {} for direction in DIRECTIONS}
+    n = 0
+    for direction, by_key in lines.items():
+        for key, intervals in by_key.items():
+            once, twice = coverage(intervals)
+            covered[direction][key] = once
+            if twice:
+                overlaps[direction][key] = ([start for start, end in twice], [end for start, end in twice])
+                n += sum(end - start + 1 for start, end in twice)
+    crossed = set()
+    names = list(DIRECTIONS)
+    for i, dir_a in enumerate(names):
+        for dir_b in names[i + 1:]:
+            crossed.update(crossings(dir_a, covered[dir_a], dir_b, covered[dir_b]))
+    n += len(crossed)
+    for x, y in crossed:
+        for direction in DIRECTIONS:
+            key = line_key(direction, x, y)
+            if key in overlaps[direction]:
+                starts, ends = overlaps[direction][key]
+                pos = y if direction == "vertical" else x
+                i = bisect.bisect_right(starts, pos) - 1
+                if i >= 0 and pos <= ends[i]:
+                    n -= 1
+    return n
+
+
+# above this many pixels the grid is not worth it (or doesn't fit in memory)
+MAX_DENSE_PIXELS = 1 << 22
+
+
+def count_overlaps(data, consider_diagonals=False, max_dense_pixels=MAX_DENSE_PIXELS):
+    """
+    Number of pixels covered by at least 2 segments, on a grid (``VentMap``)
+    if the bounding box of the segments is small enough and with
+    ``count_overlaps_sparse`` otherwise
+    """
+    segments = select_segments(data, consider_diagonals)
+    if len(segments) == 0:
+        return 0
+    if segments.min() >= 0:
+        width, height = int(segments[:, 0::2].max()) + 1, int(segments[:, 1::2].max()) + 1
+        if width * height <= max_dense_pixels:
+            return int((VentMap(data, consider_diagonals).map >= 2).sum())
+    return count_overlaps_sparse(segments)
+
+
+# PART 1
+@measure_time
+def solve1(data):
+    return count_overlaps(data)
+
+
+# PART 2
+@measure_time
+def solve2(data):
+    return count_overlaps(data, consider_diagonals=True)
+
+
+class StreamingVentMap:
+    """
+    Vent map that is filled line by line and grows when needed. Pixels only
+    count up to 2 (that's all we need to know), so they fit in a uint8 no
+    matter how many lines there are.
+    """
+
+    def __init__(self, consider_diagonals=False):
+        self.map = np.zeros((0, 0), dtype=np.uint8)
         self.consider_diagonals = consider_diagonals
-        self.fill_lines(data)
-
-    def fill_lines(self, data):
-        for (x1, y1), (x2, y2) in data:
-            if abs(x2 - x1) == abs(y2 - y1):
-                if not self.consider_diagonals:
-                    continue
-                self.diagonal_line(x1, y1, x2, y2)
-            elif x1 == x2:
-                self.horizontal_line(x1, y1, x2, y2)
-            elif y1 == y2:
-                self.vertical_line(x1, y1, x2, y2)
+
+    def ensure_size(self, x, y):
+        ny, nx = self.map.shape
+        if y >= ny or x >= nx:
+            # grow at least by a factor of 2 to not copy too often
+            new_map = np.zeros(
+                (max(y + 1, ny * 2) if y >= ny else ny, max(x + 1, nx * 2) if x >= nx else nx),
+                dtype=np.uint8,
+            )
+            new_map[:ny, :nx] = self.map
+            self.map = new_map
+
+    def add(self, x1, y1, x2, y2):
+        if abs(x2 - x1) == abs(y2 - y1):
+            if not self.consider_diagonals:
+                return
+            self.ensure_size(max(x1, x2), max(y1, y2))
+            self.diagonal_line(x1, y1, x2, y2)
+        elif x1 == x2:
+            self.ensure_size(max(x1, x2), max(y1, y2))
+            self.horizontal_line(x1, y1, x2, y2)
+        elif y1 == y2:
+            self.ensure_size(max(x1, x2), max(y1, y2))
+            self.vertical_line(x1, y1, x2, y2)
 
     def horizontal_line(self, x1, y1, x2, y2):
-        assert x1 == x2
         y1, y2 = sorted((y1, y2))
-        self.map[y1: y2 + 1, x1] += 1
+        pixels = self.map[y1: y2 + 1, x1]
+        pixels[pixels < 2] += 1
 
     def vertical_line(self, x1, y1, x2, y2):
-        assert y1 == y2
         x1, x2 = sorted((x1, x2))
-        self.map[y1, x1: x2 + 1] += 1
+        pixels = self.map[y1, x1: x2 + 1]
+        pixels[pixels < 2] += 1
 
     def diagonal_line(self, x1, y1, x2, y2):
-        assert abs(y2 - y1) == abs(x2 - x1)
         step_x = 1 if x2 >= x1 else -1
         step_y = 1 if y2 >= y1 else -1
-        for x, y in zip(range(x1, x2 + step_x, step_x), range(y1, y2 + step_y, step_y)):
-            self.map[y, x] += 1
+        xs = np.arange(x1, x2 + step_x, step_x)
+        ys = np.arange(y1, y2 + step_y, step_y)
+        self.map[ys, xs] = np.minimum(self.map[ys, xs] + 1, 2)
 
 
-# PART 1
 @measure_time
-def solve1(data):
-    vent_map = VentMap(data)
-    return (vent_map.map >= 2).sum()
-
-
-# PART 2
-@measure_time
-def solve2(data):
-    vent_map = VentMap(data, consider_diagonals=True)
-    return (vent_map.map >= 2).sum()
+def solve_stream(lines):
+    "Both parts in one pass over an iterable of lines"
+    maps = StreamingVentMap(), StreamingVentMap(consider_diagonals=True)
+    for line in lines:
+        (x1, y1), (x2, y2) = parse_line(line)
+        for vent_map in maps:
+            vent_map.add(x1, y1, x2, y2)
+    return tuple(int((vent_map.map >= 2).sum()) for vent_map in maps)
 
 
 if __name__ == "__main__":
@@ -99,8 +399,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,8 @@
+import numpy as np
 import pytest
-from solver import parse, solve1, solve2
+from .solver import (
+    parse, solve1, solve2, solve_stream, select_segments, rasterize, count_overlaps, count_overlaps_sparse
+)
 
 TESTDATA = """0,9 -> 5,9
 8,0 -> 0,8
@@ -19,7 +22,8 @@ def parsed_data():
 
 def test_parse():
     data = parse(TESTDATA)
-    # asserts go here
+    assert data.shape == (10, 4)
+    assert data[1].tolist() == [8, 0, 0, 8]
 
 
 # PART 1
@@ -32,3 +36,41 @@ def test_solve1(parsed_data):
 def test_solve2(parsed_data):
     solution = solve2(parsed_data)
     assert solution == 12
+
+
+def test_solve_stream():
+    assert solve_stream(iter(TESTDATA.split("\n"))) == (5, 12)
+
+
+def test_rasterize(parsed_data):
+    segments = select_segments(parsed_data, consider_diagonals=True)
+    grid = rasterize(segments, (10, 10))
+    assert grid.dtype == np.uint8
+    assert grid.max() == 2
+    # example diagram of part 2, saturated at 2
+    assert (grid[4] == [0, 1, 1, 2, 2, 1, 2, 2, 1, 1]).all()
+    # segments in both directions, points and a bigger grid than needed
+    segments = np.array([[3, 1, 0, 4], [0, 4, 3, 1], [5, 5, 5, 5], [2, 0, 2, 2], [0, 1, 2, 1]])
+    expected = np.zeros((6, 7), dtype=np.uint8)
+    for x, y in [(3, 1), (2, 2), (1, 3), (0, 4), (5, 5), (2, 0), (2, 1), (0, 1), (1, 1)]:
+        expected[y, x] += 1
+    expected[[1, 2, 3, 4, 1], [3, 2, 1, 0, 2]] = 2
+    assert (rasterize(segments, (6, 7)) == expected).all()
+    # long enough to go through the difference grids instead of the pixels
+    assert (rasterize(np.repeat(segments, 5, axis=0), (6, 7)) == np.minimum(expected * 5, 2)).all()
+
+
+def test_count_overlaps_sparse(parsed_data):
+    assert count_overlaps_sparse(select_segments(parsed_data)) == 5
+    assert count_overlaps_sparse(select_segments(parsed_data, consider_diagonals=True)) == 12
+    assert count_overlaps(parsed_data, True, max_dense_pixels=0) == 12
+    # far too large for a grid: the example stretched by 10**9, so the
+    # overlap of 0,9 -> 5,9 and 0,9 -> 2,9 grows to 2 * 10**9 + 1 pixels,
+    # the two other overlaps stay single pixels
+    huge = parsed_data * 10**9 + 10**12
+    assert count_overlaps(huge) == 2 * 10**9 + 3
+    # the first two diagonals cross between pixels, the 4 pixels of the
+    # first one are covered by the third one and 0,3 by the second and last
+    crossing = np.array([[0, 0, 3, 3], [0, 3, 3, 0], [0, 0, 4, 4], [0, 3, 3, 6]])
+    assert count_overlaps(crossing, True, max_dense_pixels=0) == 5
+    assert count_overlaps(crossing, True) == 5
@@ -1,23 +1,17 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
-from collections import defaultdict
+from functools import cache
+import os
+import sys
 
+import numpy as np
 
-times = []
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+# timer after spawning and timer of newborn fishes
+RESET, NEWBORN = 6, 8
+N_TIMERS = 9
 
 
 @measure_time
@@ -25,30 +19,136 @@ def parse(raw_data):
     return [int(i) for i in raw_data.split(",")]
 
 
+def n_timers(reset=RESET, newborn=NEWBORN):
+    return max(reset, newborn) + 1
+
+
+def count_timers(data, n=N_TIMERS):
+    "Number of fishes with each timer value 0 to n - 1"
+    counts = [0] * n
+    for i in data:
+        counts[i] += 1
+    return counts
+
+
+def transition_matrix(reset=RESET, newborn=NEWBORN):
+    """
+    ``M[i][j]``: how many fishes with timer i one fish with timer j turns
+    into after one day
+    """
+    n = n_timers(reset, newborn)
+    m = [[0] * n for _ in range(n)]
+    for j in range(1, n):
+        m[j - 1][j] = 1
+    m[reset][0] += 1
+    m[newborn][0] += 1
+    return m
+
+
+def mat_mul(a, b, modulus=None):
+    out = [[sum(x * y for x, y in zip(row, col)) for col in zip(*b)] for row in a]
+    if modulus is not None:
+        out = [[x % modulus for x in row] for row in out]
+    return out
+
+
+@cache
+def transition_power(k, modulus=None, reset=RESET, newborn=NEWBORN):
+    "The transition matrix to the power of ``2 ** k`` (exact, or mod ``modulus``)"
+    if k == 0:
+        return transition_matrix(reset, newborn)
+    m = transition_power(k - 1, modulus, reset, newborn)
+    return mat_mul(m, m, modulus)
+
+
+@cache
+def total_weights(days, modulus=None, reset=RESET, newborn=NEWBORN):
+    """
+    Row vector ``w`` with ``w[j]`` the number of fishes one fish with timer j
+    becomes after ``days``, i.e. the column sums of ``M ** days``. Built from
+    the cached ``M ** (2 ** k)`` of the set bits of ``days``, so it takes
+    O(log days) vector-matrix products.
+    """
+    n = n_timers(reset, newborn)
+    w = [1] * n
+    k = 0
+    while days:
+        if days & 1:
+            m = transition_power(k, modulus, reset, newborn)
+            w = [sum(w[i] * m[i][j] for i in range(n)) for j in range(n)]
+            if modulus is not None:
+                w = [x % modulus for x in w]
+        days >>= 1
+        k += 1
+    return tuple(w)
+
+
+def population(counts, days, modulus=None, reset=RESET, newborn=NEWBORN):
+    "Number of fishes after ``days`` starting from ``counts`` per timer value"
+    total = sum(w * c for w, c in zip(total_weights(days, modulus, reset, newborn), counts))
+    return total if modulus is None else total % modulus
+
+
+def populations(queries, modulus=None, reset=RESET, newborn=NEWBORN):
+    """
+    Answers for many (counts, days) queries. The weights of each distinct
+    number of days are computed once (and cached across calls), after that
+    every query is a dot product with the counts.
+    """
+    return [population(counts, days, modulus, reset, newborn) for counts, days in queries]
+
+
+def stack_populations(populations, n=N_TIMERS, dtype=np.int64):
+    "Timer counts of many initial populations (lists of timers) as columns of one matrix"
+    counts = np.zeros((n, len(populations)), dtype=dtype)
+    for j, timers in enumerate(populations):
+        counts[:, j] = np.bincount(timers, minlength=n)
+    return counts
+
+
+def daily_totals(counts, days, reset=RESET, newborn=NEWBORN):
+    """
+    Simulate the populations in the columns of ``counts`` (timers x
+    populations, e.g. from ``stack_populations``) day by day and yield the
+    number of fishes of every population for day 0 to ``days``, e.g. for
+    plotting. With an ``int64`` matrix an ``OverflowError`` is raised before
+    the counts get too large; use ``dtype=object`` for exact python ints.
+    """
+    counts = np.array(counts)
+    n = n_timers(reset, newborn)
+    if counts.shape[0] != n:
+        raise ValueError(f"expected counts for {n} timer values, got {counts.shape[0]}")
+    check_overflow = counts.dtype != object
+    yield counts.sum(axis=0)
+    for _ in range(days):
+        spawning = counts[0].copy()
+        counts = np.roll(counts, -1, axis=0)
+        counts[n - 1] = 0
+        counts[reset] += spawning
+        counts[newborn] += spawning
+        # the sum of n counts must stay below 2 ** 63
+        if check_overflow and counts.max() >= 2**63 // (2 * n):
+            raise OverflowError("counts too large for int64, use dtype=object")
+        yield counts.sum(axis=0)
+
+
+def simulate(counts, days, reset=RESET, newborn=NEWBORN):
+    "Number of fishes of every population (column of ``counts``) after ``days``"
+    for totals in daily_totals(counts, days, reset, newborn):
+        pass
+    return totals
+
+
 # PART 1
 @measure_time
 def solve1(data):
-    fishes = data[:]
-    for i in range(80):
-        new_fishes = len([f for f in fishes if f == 0])
-        fishes = [f-1 if f != 0 else 6 for f in fishes] + [8] * new_fishes
-    return len(fishes)
+    return population(count_timers(data), 80)
 
 
 # PART 2
 @measure_time
 def solve2(data, ndays=256):
-    fishes = defaultdict(int)
-    for i in data:
-        fishes[i] += 1
-    for day in range(ndays):
-        prev_fishes = fishes.copy()
-        fishes[8] = 0
-        for i in range(7, -1, -1):
-            fishes[i] = prev_fishes[i + 1]
-        fishes[6] += prev_fishes[0]
-        fishes[8] += prev_fishes[0]
-    return sum(fishes.values())
+    return population(count_timers(data), ndays)
 
 
 if __name__ == "__main__":
@@ -58,8 +158,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,7 @@
 import pytest
-from solver import parse, solve1, solve2
+from .solver import (
+    parse, solve1, solve2, count_timers, population, populations, stack_populations, daily_totals, simulate
+)
 
 TESTDATA = """3,4,3,1,2"""
 
@@ -23,3 +25,53 @@ def test_solve1(parsed_data):
 def test_solve2(parsed_data):
     solution = solve2(parsed_data, 18)
     assert solution == 26
+
+
+def simulate_naive(data, days):
+    "The naive way, one fish at a time"
+    fishes = list(data)
+    for _ in range(days):
+        new_fishes = fishes.count(0)
+        fishes = [f - 1 if f != 0 else 6 for f in fishes] + [8] * new_fishes
+    return len(fishes)
+
+
+def test_population(parsed_data):
+    counts = count_timers(parsed_data)
+    assert counts == [0, 1, 1, 2, 1, 0, 0, 0, 0]
+    for days in (0, 1, 7, 9, 18, 31, 64):
+        assert population(counts, days) == simulate_naive(parsed_data, days)
+    assert population(counts, 256) == 26984457539
+    # huge numbers of days, exact or modulo
+    big = population(counts, 10**4)
+    assert big > 10**370
+    assert population(counts, 10**4, modulus=10**9 + 7) == big % (10**9 + 7)
+    assert populations([(counts, 18), ([1] + [0] * 8, 0), (counts, 80)]) == [26, 1, 5934]
+
+
+def test_simulate(parsed_data):
+    populations = [parsed_data, [0], [8, 8], [1, 2, 3, 4, 5, 6]]
+    counts = stack_populations(populations)
+    assert counts[:, 0].tolist() == count_timers(parsed_data)
+    assert simulate(counts, 80).tolist() == [population(count_timers(p), 80) for p in populations]
+    totals = list(daily_totals(counts[:, :1], 18))
+    assert len(totals) == 19
+    assert [t[0] for t in totals[:4]] == [5, 5, 6, 7]
+    assert totals[-1][0] == 26
+
+    # int64 overflows at some point, python ints don't
+    with pytest.raises(OverflowError):
+        simulate(counts, 500)
+    exact = simulate(stack_populations(populations, dtype=object), 500)
+    assert exact.tolist() == [population(count_timers(p), 500) for p in populations]
+
+
+def test_other_cycles():
+    # spawning every 3 days, newborns need 2 more days
+    reset, newborn = 2, 4
+    counts = stack_populations([[0], [4, 1]], n=5)
+    for days in (0, 1, 5, 20):
+        expected = [population(count_timers(p, 5), days, reset=reset, newborn=newborn) for p in ([0], [4, 1])]
+        assert simulate(counts, days, reset, newborn).tolist() == expected
+    # one fish: spawns on day 1 (timers 2 and 4), again on day 4 (2, 4, 1) ...
+    assert list(simulate(counts[:, :1], d, reset, newborn)[0] for d in range(6)) == [1, 2, 2, 2, 3, 3]
@@ -1,49 +1,168 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
-
-
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+import math
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
+
+
+class PolynomialCost:
+    """
+    Fuel of one crab as a polynomial of its distance d:
+    ``sum(coeffs[i] * d ** i) // divisor`` (the division has to be exact for
+    every d). For these the total over a fleet follows from prefix sums of
+    powers of the positions, see ``Fleet.cost``.
+    """
+
+    def __init__(self, coeffs, divisor=1):
+        self.coeffs = tuple(coeffs)
+        self.divisor = divisor
+
+    def __call__(self, distances):
+        return sum(c * distances**i for i, c in enumerate(self.coeffs)) // self.divisor
+
+    def __repr__(self):
+        return f"PolynomialCost({list(self.coeffs)}, divisor={self.divisor})"
+
+
+LINEAR = PolynomialCost([0, 1])
+# 1 + 2 + ... + d
+TRIANGULAR = PolynomialCost([0, 1, 1], divisor=2)
+
+
+class Fleet:
+    """
+    Crab positions, sorted once, for evaluating the total fuel of alignment
+    positions under any cost model: a ``PolynomialCost`` or any convex,
+    non-decreasing function of the distance that works on numpy arrays
+    (e.g. ``lambda d: d ** 3``).
+    """
+
+    def __init__(self, positions):
+        self.positions = np.sort(np.asarray(positions, dtype=np.int64))
+        self.unique, self.counts = np.unique(self.positions, return_counts=True)
+        self.total = int(self.positions.sum())
+        self._power_sums = {}
+
+    def __len__(self):
+        return len(self.positions)
+
+    def power_sums(self, j):
+        """
+        ``power_sums(j)[k]``: sum of the j-th powers of the k leftmost
+        positions (exact, as python ints in an object array)
+        """
+        if j not in self._power_sums:
+            powers = self.positions.astype(object) ** j
+            self._power_sums[j] = np.concatenate([[0], np.cumsum(powers)]).astype(object)
+        return self._power_sums[j]
+
+    def polynomial_cost(self, pos, model):
+        """
+        Total fuel for one or many positions (numpy array) under a
+        ``PolynomialCost``. With k crabs left of pos, the distances there are
+        pos - x and sum((pos - x) ** i) expands into binomials of pos and the
+        prefix power sums of x, likewise for the crabs right of pos.
+        """
+        k = np.searchsorted(self.positions, pos, side="right")
+        pos = np.asarray(pos).astype(object)
+        total = 0
+        for i, c in enumerate(model.coeffs):
+            if c == 0:
+                continue
+            for j in range(i + 1):
+                sums = self.power_sums(j)
+                left, right = sums[k], sums[-1] - sums[k]
+                binomial = math.comb(i, j)
+                total = total + c * binomial * (
+                    pos ** (i - j) * (-1) ** j * left + (-pos) ** (i - j) * right
+                )
+        return total // model.divisor
+
+    def cost(self, pos, model=LINEAR):
+        "Total fuel to align all crabs at ``pos`` under ``model``"
+        if isinstance(model, PolynomialCost):
+            return int(self.polynomial_cost(pos, model))
+        return self.cost_curve([pos], model)[0].item()
+
+    def cost_curve(self, positions, model=LINEAR, max_cells=1 << 22):
+        """
+        Total fuel for each of ``positions`` in one batch: one vectorized
+        pass over the prefix sums for a ``PolynomialCost``, otherwise the
+        model is evaluated on the (candidates x distinct crab positions)
+        distance matrix, in chunks of at most ``max_cells`` entries, and
+        weighted with the counts. Float valued models give float costs.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        if isinstance(model, PolynomialCost):
+            return self.polynomial_cost(positions, model)
+        chunk = max(1, max_cells // len(self.unique))
+        curves = [
+            model(np.abs(self.unique[None, :] - positions[i:i + chunk, None])) @ self.counts
+            for i in range(0, len(positions), chunk)
+        ]
+        return np.concatenate(curves) if curves else np.zeros(0)
+
+    def optimize(self, model=LINEAR):
+        """
+        (position, cost) with the least total fuel under a convex ``model``.
+        The total is convex in the position as well, so a binary search
+        for where it stops decreasing (an integer ternary search) needs
+        O(log range) cost evaluations.
+        """
+        lo, hi = int(self.positions[0]), int(self.positions[-1])
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.cost(mid, model) <= self.cost(mid + 1, model):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo, self.cost(lo, model)
+
+    def linear_cost(self, pos):
+        "Sum of |x - pos|"
+        return self.cost(pos, LINEAR)
+
+    def triangular_cost(self, pos):
+        "Sum of 1 + 2 + ... + |x - pos|"
+        return self.cost(pos, TRIANGULAR)
+
+    def best_linear(self):
+        "(position, cost): any median is optimal"
+        pos = int(self.positions[len(self) // 2])
+        return pos, self.linear_cost(pos)
+
+    def best_triangular(self):
+        """
+        (position, cost): the optimum of the (convex) triangular cost lies
+        within 1/2 of the mean, so only the integers around it are checked
+        """
+        mean = self.total // len(self)
+        return min(
+            ((pos, self.triangular_cost(pos)) for pos in range(mean - 1, mean + 3)),
+            key=lambda item: item[1],
+        )
 
 
 @measure_time
 def parse(raw_data):
-    return [int(i) for i in raw_data.split(",")]
+    return Fleet([int(i) for i in raw_data.split(",")])
 
 
 # PART 1
 @measure_time
 def solve1(data):
-    fuel_spendings = []
-    for pos in range(min(data), max(data) + 1):
-        fuel_spendings.append(sum(abs(crab_pos - pos) for crab_pos in data))
-    return min(fuel_spendings)
-
-
-def sum_range(n):
-    return n * (n - 1) // 2
+    return data.best_linear()[1]
 
 
 # PART 2
 @measure_time
 def solve2(data):
-    fuel_spendings = []
-    for pos in range(min(data), max(data) + 1):
-        fuel_spendings.append(sum(sum_range(abs(crab_pos - pos) + 1) for crab_pos in data))
-    return min(fuel_spendings)
+    return data.best_triangular()[1]
 
 
 if __name__ == "__main__":
@@ -53,8 +172,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,6 @@
+import numpy as np
 import pytest
-from solver import parse, solve1, solve2
+from .solver import parse, solve1, solve2, Fleet, PolynomialCost, LINEAR, TRIANGULAR
 
 TESTDATA = """16,1,2,0,4,2,7,1,2,14"""
 
@@ -16,10 +17,53 @@ def test_parse():
 # PART 1
 def test_solve1(parsed_data):
     solution = solve1(parsed_data)
-
+    assert solution == 37
 
 
 # PART 2
 def test_solve2(parsed_data):
     solution = solve2(parsed_data)
     assert solution == 168
+
+
+def test_fleet():
+    rng = np.random.default_rng(0)
+    for n in (1, 2, 5, 50):
+        positions = rng.integers(0, 100, n).tolist()
+        fleet = Fleet(positions)
+        costs1, costs2 = [], []
+        for pos in range(-2, 103):
+            distances = [abs(x - pos) for x in positions]
+            costs1.append(sum(distances))
+            costs2.append(sum(d * (d + 1) // 2 for d in distances))
+            assert fleet.linear_cost(pos) == costs1[-1]
+            assert fleet.triangular_cost(pos) == costs2[-1]
+        assert fleet.best_linear()[1] == min(costs1)
+        assert fleet.best_triangular()[1] == min(costs2)
+
+
+def test_cost_models(parsed_data):
+    fleet = parsed_data
+    candidates = np.arange(-3, 20)
+    models = [LINEAR, TRIANGULAR, PolynomialCost([1, 0, 3, 2]), lambda d: d**3, lambda d: np.maximum(d - 2, 0)]
+    for model in models:
+        distances = np.abs(np.array([16, 1, 2, 0, 4, 2, 7, 1, 2, 14])[None, :] - candidates[:, None])
+        expected = model(distances).sum(axis=1)
+        assert list(fleet.cost_curve(candidates, model)) == expected.tolist()
+        pos, cost = fleet.optimize(model)
+        assert cost == expected.min()
+        assert fleet.cost(pos, model) == cost
+    assert fleet.optimize(LINEAR) == (2, 37)
+    assert fleet.optimize(TRIANGULAR) == (5, 168)
+
+
+def test_float_cost_models():
+    fleet = Fleet([0, 0, 0, 1])
+    assert fleet.cost(0, lambda d: 0.4 * d * d) == pytest.approx(0.4)
+    fleet = Fleet([5, 3, 3])
+    pos, cost = fleet.optimize(lambda d: 0.1369 * d**2)
+    assert pos == 4
+    assert cost == pytest.approx(0.1369 * 3)
+    assert fleet.cost_curve([3, 4, 5], lambda d: 0.5 * d) == pytest.approx([1.0, 1.5, 2.0])
+    # integer models stay python ints
+    assert isinstance(fleet.cost(4, lambda d: d**3), int)
@@ -1,99 +1,131 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
-from collections import defaultdict
+import os
+import sys
 
+import numpy as np
 
-times = []
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
+# segments of each digit with the standard wiring, as bits a = 1, b = 2, ... g = 64
+SEGMENTS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+N_PATTERNS, N_OUTPUT = 10, 4
 
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
+# number of set bits of every 7 bit pattern
+POPCOUNT = np.array([bin(i).count("1") for i in range(128)], dtype=np.int64)
 
-    return _func
 
+def to_mask(pattern):
+    mask = 0
+    for letter in pattern:
+        mask |= 1 << (ord(letter) - ord("a"))
+    return mask
+
+
+def signature(mask, one, four):
+    """
+    Index of a pattern in SIGNATURES: its number of segments and how many of
+    them it shares with the patterns of 1 and 4. That doesn't depend on the
+    wiring and is different for every digit.
+    """
+    return POPCOUNT[mask] * 25 + POPCOUNT[mask & one] * 5 + POPCOUNT[mask & four]
+
+
+def signature_table():
+    "signature -> digit (255 for signatures no digit has)"
+    masks = [to_mask(segments) for segments in SEGMENTS]
+    table = np.full(8 * 25, 255, dtype=np.uint8)
+    for digit, mask in enumerate(masks):
+        table[signature(mask, masks[1], masks[4])] = digit
+    assert len(set(table[table != 255])) == 10
+    return table
+
+
+SIGNATURES = signature_table()
+N_ACTIVATED = {digit: len(segments) for digit, segments in enumerate(SEGMENTS)}
+UNIQUE_LENGTHS = [N_ACTIVATED[i] for i in [1, 4, 7, 8]]
+
+
+def parse_line(line):
+    sequence, output = line.split("|")
+    return [to_mask(p) for p in sequence.split()], [to_mask(p) for p in output.split()]
 
-def parse_generator(raw_data):
-    for line in raw_data.split("\n"):
-        sequence, output = line.split("|")
-        yield sequence.split(), output.split()
 
 @measure_time
 def parse(raw_data):
-    return list(parse_generator(raw_data))
-
-
-N_ACTIVATED = {
-    0: 6,
-    1: 2,
-    2: 5,
-    3: 5,
-    4: 4,
-    5: 5,
-    6: 6,
-    7: 3,
-    8: 7,
-    9: 6,
-}
+    """
+    The 10 patterns and 4 output digits of every display as 7 bit masks, in
+    a (displays, 10) and a (displays, 4) uint8 array. Letters are turned into
+    bits and summed per word without a python loop over the words.
+    """
+    buffer = np.frombuffer(raw_data.encode(), dtype=np.uint8)
+    is_letter = (buffer >= ord("a")) & (buffer <= ord("g"))
+    starts = is_letter & ~np.concatenate([[False], is_letter[:-1]])
+    word = np.cumsum(starts)[is_letter] - 1
+    bits = np.left_shift(1, buffer[is_letter] - ord("a"), dtype=np.int64)
+    masks = np.bincount(word, weights=bits, minlength=int(starts.sum())).astype(np.uint8)
+    if len(masks) % (N_PATTERNS + N_OUTPUT):
+        raise ValueError(f"every line needs {N_PATTERNS} patterns and {N_OUTPUT} output digits")
+    masks = masks.reshape(-1, N_PATTERNS + N_OUTPUT)
+    return masks[:, :N_PATTERNS], masks[:, N_PATTERNS:]
+
+
+def figure_out_mapping(patterns):
+    "pattern (mask) -> digit for the 10 patterns of one display"
+    one = next(p for p in patterns if POPCOUNT[p] == 2)
+    four = next(p for p in patterns if POPCOUNT[p] == 4)
+    return {p: int(SIGNATURES[signature(p, one, four)]) for p in patterns}
+
+
+def decode_line(patterns, output):
+    "The number shown by one display"
+    one = next(p for p in patterns if POPCOUNT[p] == 2)
+    four = next(p for p in patterns if POPCOUNT[p] == 4)
+    value = 0
+    for p in output:
+        value = value * 10 + int(SIGNATURES[signature(p, one, four)])
+    return value
+
+
+def decode(patterns, outputs):
+    "The numbers shown by all displays at once (vectorized version of ``decode_line``)"
+    rows = np.arange(len(patterns))
+    counts = POPCOUNT[patterns]
+    # without exactly one 1 and one 4, argmax would silently pick pattern 0
+    if ((counts == 2).sum(axis=1) != 1).any() or ((counts == 4).sum(axis=1) != 1).any():
+        raise ValueError("every display needs exactly one pattern for 1 and one for 4")
+    one = patterns[rows, np.argmax(counts == 2, axis=1)][:, None]
+    four = patterns[rows, np.argmax(counts == 4, axis=1)][:, None]
+    digits = SIGNATURES[signature(outputs, one, four)]
+    if (digits == 255).any():
+        raise ValueError("invalid pattern in the output")
+    return digits.astype(np.int64) @ 10 ** np.arange(N_OUTPUT - 1, -1, -1)
+
 
 # PART 1
 @measure_time
 def solve1(data):
-    unique_lens = set(N_ACTIVATED[i] for i in [1, 4, 7, 8])
-    total = 0
-    for sequence, output in data:
-        for digit in output:
-            if len(digit) in unique_lens:
-                total += 1
-    return total
-
-
-def find_numbers(sequence):
-    sequence = set(frozenset(i) for i in sequence)
-    found_numbers = {
-        k: [frozenset(x) for x in sequence if len(x) == N_ACTIVATED[k]][0]
-        for k in [1, 4, 7, 8]
-    }
-
-    def matches(length, filter):
-        found = [
-            frozenset(x)
-            for x in sequence
-            if (
-                len(x) == length
-                and filter(set(x))
-                and not frozenset(x) in found_numbers.values()
-            )
-        ]
-        assert len(found) == 1
-        return found[0]
-
-    bd = found_numbers[4].difference(found_numbers[1])
-    found_numbers[0] = matches(6, lambda x: not bd.issubset(x))
-    cf = found_numbers[1]
-    found_numbers[6] = matches(6, lambda x: not cf.issubset(x))
-    found_numbers[9] = matches(6, lambda x: True)
-    found_numbers[5] = matches(5, lambda x: bd.issubset(x))
-    found_numbers[3] = matches(5, lambda x: cf.issubset(x))
-    found_numbers[2] = matches(5, lambda x: True)
-    return {v: k for k, v in found_numbers.items()}
+    patterns, outputs = data
+    return int(np.isin(POPCOUNT[outputs], UNIQUE_LENGTHS).sum())
 
 
 # PART 2
 @measure_time
 def solve2(data):
-    total = 0
-    for sequence, output in data:
-        number_map = find_numbers(sequence + output)
-        total += int("".join(str(number_map[frozenset(letters)]) for letters in output))
-    return total
+    return int(decode(*data).sum())
+
+
+@measure_time
+def solve_stream(lines):
+    "Both parts in one pass over an iterable of lines"
+    total1 = 0
+    total2 = 0
+    for line in lines:
+        patterns, output = parse_line(line)
+        total1 += sum(POPCOUNT[p] in UNIQUE_LENGTHS for p in output)
+        total2 += decode_line(patterns, output)
+    return total1, total2
 
 
 if __name__ == "__main__":
@@ -103,8 +135,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,7 @@
 import pytest
-from solver import parse, solve1, solve2, figure_out_mapping
+from .solver import (
+    parse, parse_line, solve1, solve2, solve_stream, to_mask, figure_out_mapping, decode_line, decode
+)
 
 TESTDATA = """be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | fdgacbe cefdb cefbgd gcbe
 edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | fcgedb cgb dgebacf gc
@@ -18,17 +20,46 @@ def parsed_data():
 
 
 def test_parse():
-    data = parse(TESTDATA)
-    assert data[0] == (["be", "cfbegad", "cbdgef", "fgaecd", "cgeb", "fdcge", "agebfd", "fecdb", "fabcd", "edb"], ["fdgacbe", "cefdb", "cefbgd", "gcbe"])
+    patterns, outputs = parse(TESTDATA)
+    assert patterns.shape == (10, 10)
+    assert outputs.shape == (10, 4)
+    assert patterns[0].tolist() == [to_mask(p) for p in ["be", "cfbegad", "cbdgef", "fgaecd", "cgeb", "fdcge", "agebfd", "fecdb", "fabcd", "edb"]]
+    assert outputs[0].tolist() == [to_mask(p) for p in ["fdgacbe", "cefdb", "cefbgd", "gcbe"]]
+    assert to_mask("be") == 0b10010
 
 
 # PART 1
 def test_solve1(parsed_data):
     solution = solve1(parsed_data)
-    # asserts go here
+    assert solution == 26
 
 
 # PART 2
 def test_solve2(parsed_data):
     solution = solve2(parsed_data)
-    # asserts go here
+    assert solution == 61229
+
+
+def test_solve_stream():
+    assert solve_stream(iter(TESTDATA.split("\n"))) == (26, 61229)
+
+
+def test_decode(parsed_data):
+    example = "acedgfb cdfbe gcdfa fbcad dab cefabd cdfgeb eafb cagedb ab | cdfeb fcadb cdfeb cdbaf"
+    patterns, output = parse_line(example)
+    mapping = figure_out_mapping(patterns)
+    assert [mapping[to_mask(p)] for p in ["acedgfb", "cdfbe", "gcdfa", "fbcad", "dab"]] == [8, 5, 2, 3, 7]
+    assert decode_line(patterns, output) == 5353
+    values = decode(*parsed_data)
+    assert values.tolist() == [8394, 9781, 1197, 9361, 4873, 8418, 4548, 1625, 8717, 4315]
+    assert values.tolist() == [decode_line(*parse_line(line)) for line in TESTDATA.split("\n")]
+
+
+def test_decode_invalid():
+    line = TESTDATA.split("\n")[0]
+    # two patterns of two segments, so it's unknown which one is the 1
+    with pytest.raises(ValueError):
+        decode(*parse(line.replace("edb", "ed")))
+    # no pattern of four segments
+    with pytest.raises(ValueError):
+        decode(*parse(line.replace("cgeb", "cgebf")))
@@ -1,53 +1,33 @@
 #!/usr/bin/env python
 
-from functools import wraps, reduce
-from datetime import datetime
+from functools import reduce
 from operator import mul
+import numpy as np
+import os
+import sys
 
-
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import map_file, parse_grid, to_digits
+from aoc.timing import measure_time, print_report
 
 
 @measure_time
 def parse(raw_data):
-    return [[int(x) for x in line] for line in raw_data.split("\n")]
-
-
-def higher_or_none(data, height, x, y):
-    if x < 0 or y < 0:
-        return True
-    try:
-        return data[y][x] > height
-    except IndexError:
-        return True
+    return to_digits(parse_grid(raw_data))
 
 
 def find_low_points(data):
-    low_points = []
-    for y, line in enumerate(data):
-        for x, height in enumerate(line):
-            check = lambda x, y: higher_or_none(data, height, x, y)
-            if (
-                check(x - 1, y)
-                and check(x + 1, y)
-                and check(x, y - 1)
-                and check(x, y + 1)
-            ):
-                low_points.append((x, y, height))
-                continue
-    return low_points
+    # pad with something higher than any point, so the border needs no special care
+    padded = np.pad(data, 1, constant_values=10)
+    center = padded[1:-1, 1:-1]
+    is_low = (
+        (center < padded[1:-1, :-2])
+        & (center < padded[1:-1, 2:])
+        & (center < padded[:-2, 1:-1])
+        & (center < padded[2:, 1:-1])
+    )
+    ys, xs = np.nonzero(is_low)
+    return [(int(x), int(y), int(data[y, x])) for x, y in zip(xs, ys)]
 
 
 # PART 1
@@ -101,12 +81,8 @@ def solve2(data):
 if __name__ == "__main__":
     import sys
 
-    data = parse(open("input.txt").read().strip())
+    data = parse(map_file("input.txt"))
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
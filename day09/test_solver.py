@@ -1,5 +1,5 @@
 import pytest
-from solver import parse, solve1, solve2
+from .solver import parse, solve1, solve2
 
 TESTDATA = """2199943210
 3987894921
@@ -1,22 +1,10 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
+import os
+import sys
 
-
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
 
 @measure_time
@@ -110,6 +98,31 @@ def solve2(data):
     return sorted(scores)[len(scores) // 2]
 
 
+def completion_score(closing_sequence):
+    score = 0
+    for c in closing_sequence:
+        score = score * 5 + COMPLETION_ERR_SCORES[c]
+    return score
+
+
+@measure_time
+def solve_stream(lines):
+    """
+    Both parts in one pass over an iterable of lines. Part 2 needs the median
+    of all completion scores, so those (but not the lines) are kept.
+    """
+    err_score = 0
+    scores = []
+    for line in lines:
+        res = check_line(line)
+        if isinstance(res, tuple):
+            closing, pos = res
+            err_score += ERR_SCORES[closing]
+        elif res is not None:
+            scores.append(completion_score(complete(line)))
+    return err_score, sorted(scores)[len(scores) // 2]
+
+
 if __name__ == "__main__":
     import sys
 
@@ -117,8 +130,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,5 @@
 import pytest
-from solver import parse, solve1, solve2
+from .solver import parse, solve1, solve2, solve_stream
 
 TESTDATA = """[({(<(())[]>[[{[]{<()<>>
 [(()[<>])]({[<{<<[]>>(
@@ -32,3 +32,7 @@ def test_solve1(parsed_data):
 def test_solve2(parsed_data):
     solution = solve2(parsed_data)
     assert solution == 288957
+
+
+def test_solve_stream():
+    assert solve_stream(iter(TESTDATA.split("\n"))) == (26397, 288957)
@@ -1,28 +1,17 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
 import numpy as np
+import os
+import sys
 
-
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import map_file, parse_grid, to_digits
+from aoc.timing import measure_time, print_report
 
 
 @measure_time
 def parse(raw_data):
-    return [[int(i) for i in line] for line in raw_data.split("\n")]
+    return to_digits(parse_grid(raw_data))
 
 
 class OctopusAutomaton:
@@ -84,7 +73,7 @@ class OctopusAutomaton:
 
 # PART 1
 @measure_time
-def solve1(data, steps=10):
+def solve1(data, steps=100):
     automaton = OctopusAutomaton(data)
     total = 0
     for i in range(steps):
@@ -100,7 +89,7 @@ def solve2(data):
     i = 1
     while True:
         automaton.step()
-        if automaton.flashing.sum() == 100:
+        if automaton.flashing.all():
             return i
         i += 1
 
@@ -108,12 +97,8 @@ def solve2(data):
 if __name__ == "__main__":
     import sys
 
-    data = parse(open("input.txt").read().strip())
-    print("Part 1: {}".format(solve1(data, 100)))
+    data = parse(map_file("input.txt"))
+    print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,5 @@
 import pytest
-from solver import parse, solve1, solve2
+from .solver import parse, solve1, solve2
 
 TESTDATA = """start-A
 start-b
@@ -1,27 +1,17 @@
 #!/usr/bin/env python
 
-from functools import wraps, cache
-from datetime import datetime
+from functools import cache
+import os
+import sys
 
-
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import map_file, parse_grid, to_digits
+from aoc.timing import measure_time, print_report
 
 
 @measure_time
 def parse(raw_data):
-    return [[int(i) for i in line] for line in raw_data.split("\n")]
+    return to_digits(parse_grid(raw_data))
 
 
 def get_graph(grid):
@@ -32,7 +22,7 @@ def get_graph(grid):
         if any(x < 0 for x in (x0, y0, x1, y1)):
             return
         try:
-            G.add_edge((x0, y0), (x1, y1), weight=grid[y1][x1])
+            G.add_edge((x0, y0), (x1, y1), weight=int(grid[y1][x1]))
         except IndexError:
             pass
 
@@ -86,12 +76,8 @@ def solve2(data):
 if __name__ == "__main__":
     import sys
 
-    data = parse(open("input.txt").read().strip())
+    data = parse(map_file("input.txt"))
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
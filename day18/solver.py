@@ -1,23 +1,11 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
 import math
+import os
+import sys
 
-
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
 
 def tokenize(line):
@@ -72,7 +60,6 @@ def split_number_at(tokens, i):
     tokens.insert(i, "[")
 
 
-
 def reduce_snailnum(tokens):
     while True:
         if (i := find_exploding_pair(tokens)) is not None:
@@ -140,8 +127,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
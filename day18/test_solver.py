@@ -1,5 +1,5 @@
 import pytest
-from solver import (
+from .solver import (
     tokenize,
     parse,
     solve1,
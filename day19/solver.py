@@ -1,22 +1,12 @@
 #!/usr/bin/env python
 
-from functools import wraps, cache
-from datetime import datetime
+from functools import cache
 import numpy as np
+import os
+import sys
 
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
 
 @measure_time
@@ -91,6 +81,10 @@ def find_shift(coords1, coords2, n_for_success):
                 return (dx, dy, dz), overlapping
 
 
+# memos keyed by the input, aoc.batch clears them after every input
+INPUT_CACHES = ("solve",)
+
+
 @cache
 def solve(data):
     n_total = len(data)
@@ -156,8 +150,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
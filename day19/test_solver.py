@@ -1,5 +1,5 @@
 import pytest
-from solver import parse, solve1, solve2
+from .solver import parse, solve1, solve2
 
 TESTDATA = """--- scanner 0 ---
 404,-588,-901
@@ -149,12 +149,14 @@ def test_parse():
 
 
 # PART 1
-def test_solve1(parsed_data):
-    solution = solve1(parsed_data)
+@pytest.mark.slow
+def test_solve1(parsed_data, solve_cached):
+    solution = solve_cached(solve1, parsed_data)
     assert solution == 79
 
 
 # PART 2
-def test_solve2(parsed_data):
-    solution = solve2(parsed_data)
+@pytest.mark.slow
+def test_solve2(parsed_data, solve_cached):
+    solution = solve_cached(solve2, parsed_data)
     assert solution == 3621
@@ -1,33 +1,25 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
 from collections import defaultdict
 from itertools import product
 import numpy as np
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
-times = []
 
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+def parse_line(line):
+    onoff, coords = line.split()
+    xr, yr, zr = coords.split(",")
+    xr, yr, zr = [tuple(int(i) for i in s.split("=")[1].split("..")) for s in [xr, yr, zr]]
+    return onoff, xr, yr, zr
 
 
 def parse_gen(raw_data):
     for line in raw_data.split("\n"):
-        onoff, coords = line.split()
-        xr, yr, zr = coords.split(",")
-        xr, yr, zr = [tuple(int(i) for i in s.split("=")[1].split("..")) for s in [xr, yr, zr]]
-        yield onoff, xr, yr, zr
+        yield parse_line(line)
 
 
 @measure_time
@@ -93,6 +85,27 @@ def solve2(data):
         n_on += (hist[i] * bin_volumes).sum()
     return n_on
 
+
+@measure_time
+def solve_stream(lines):
+    """
+    Both parts in one pass over an iterable of lines. Part 1 only needs the
+    fixed -50..50 region, but part 2 depends on all cuboids, so the parsed
+    steps (not the lines) are kept for it.
+    """
+    region = np.zeros((101, 101, 101), dtype=bool)
+    steps = []
+    for line in lines:
+        onoff, xr, yr, zr = step = parse_line(line)
+        steps.append(step)
+        if any(r[0] < -50 or r[1] > 50 for r in (xr, yr, zr)):
+            continue
+        region[
+            xr[0] + 50: xr[1] + 51, yr[0] + 50: yr[1] + 51, zr[0] + 50: zr[1] + 51
+        ] = onoff == "on"
+    return int(region.sum()), solve2(steps)
+
+
 if __name__ == "__main__":
     import sys
 
@@ -100,8 +113,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
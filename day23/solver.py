@@ -1,23 +1,11 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
-from tqdm import tqdm
 import json
+import os
+import sys
 
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
 
 @measure_time
@@ -150,6 +138,9 @@ class AmphiGame:
         if min_energy_for_map is None:
             min_energy_for_map = {}
         if level == 0 and self.progress:
+            # only needed for the progress bar
+            from tqdm import tqdm
+
             iter_occ = tqdm(self.occupied)
         else:
             iter_occ = self.occupied
@@ -237,7 +228,6 @@ class UnfoldedAmphiGame(AmphiGame):
         return new
 
 
-
 # PART 2
 @measure_time
 def solve2(data):
@@ -255,8 +245,4 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
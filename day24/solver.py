@@ -1,26 +1,15 @@
 #!/usr/bin/env python
 
-from functools import wraps, cache
-from datetime import datetime
+from functools import cache
 from collections import defaultdict
 from itertools import product
 from dataclasses import dataclass
 import math
+import os
+import sys
 
-
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.timing import measure_time, print_report
 
 
 @measure_time
@@ -135,6 +124,10 @@ def calculate_z0_options(block, z1, w):
     return options
 
 
+# memos keyed by the input, aoc.batch clears them after every input
+INPUT_CACHES = ("find_possible_combinations",)
+
+
 @cache
 def find_possible_combinations(block, z_expected, iterate_reversed=True):
     combinations = []
@@ -201,11 +194,7 @@ if __name__ == "__main__":
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
 
     # blocks = split_blocks(data)
     # for i in range(len(blocks[0])):
@@ -1,5 +1,5 @@
 import pytest
-from solver import parse, solve1, solve2, run
+from .solver import parse, solve1, solve2, run
 
 TESTDATA = """inp w
 add z w
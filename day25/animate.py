@@ -8,7 +8,7 @@ data = parse(open("input.txt").read().strip())
 
 def print_grid(grid):
     sys.stdout.write("\033c")
-    sys.stdout.write("\n".join("".join(line) for line in grid))
+    sys.stdout.write("\n".join(line.tobytes().decode() for line in grid))
     sys.stdout.flush()
 
 grid = data
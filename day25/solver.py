@@ -1,47 +1,35 @@
 #!/usr/bin/env python
 
-from functools import wraps
-from datetime import datetime
 import numpy as np
+import os
+import sys
 
-times = []
-
-
-def measure_time(func):
-    @wraps(func)
-    def _func(*args, **kwargs):
-        start = datetime.now()
-        result = func(*args, **kwargs)
-        end = datetime.now()
-        times.append((func.__name__, (end - start).total_seconds()))
-        return result
-
-    return _func
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.grid import map_file, parse_grid
+from aoc.timing import measure_time, print_report
 
 
 @measure_time
 def parse(raw_data):
-    return np.array([list(line) for line in raw_data.strip().split("\n")])
+    "grid of the character codes (uint8)"
+    return parse_grid(raw_data)
 
 
-def updated(grid):
-    new_grid = np.array(grid)
-    dy, dx = grid.shape
-    for y, line in enumerate(grid):
-        for x, v in enumerate(line):
-            if v == ">" and grid[y, (x + 1) % dx] == ".":
-                new_grid[y, x] = "."
-                new_grid[y, (x + 1) % dx] = ">"
-    grid = new_grid
+EMPTY, EAST, SOUTH = (ord(c) for c in ".>v")
+
+
+def move_herd(grid, herd, axis):
+    can_move = (grid == herd) & (np.roll(grid, -1, axis=axis) == EMPTY)
     new_grid = np.array(grid)
-    for y, line in enumerate(grid):
-        for x, v in enumerate(line):
-            if v == "v" and grid[(y + 1) % dy, x] == ".":
-                new_grid[y, x] = "."
-                new_grid[(y + 1) % dy, x] = "v"
+    new_grid[can_move] = EMPTY
+    new_grid[np.roll(can_move, 1, axis=axis)] = herd
     return new_grid
 
 
+def updated(grid):
+    return move_herd(move_herd(grid, EAST, axis=1), SOUTH, axis=0)
+
+
 # PART 1
 @measure_time
 def solve1(data, max_iter=10000):
@@ -61,12 +49,8 @@ def solve2(data):
 if __name__ == "__main__":
     import sys
 
-    data = parse(open("input.txt").read().strip())
+    data = parse(map_file("input.txt"))
     print("Part 1: {}".format(solve1(data)))
     print("Part 2: {}".format(solve2(data)))
 
-    print("\nTime taken:")
-    for func, time in times:
-        print(f"{func:8}{time}s")
-    print("----------------")
-    print("total   {}s".format(sum(t for _, t in times)))
+    print_report()
@@ -1,5 +1,5 @@
 import pytest
-from solver import parse, solve1, solve2, updated
+from .solver import parse, solve1, solve2, updated
 import numpy as np
 
 TESTDATA = """
@@ -29,15 +29,15 @@ def test_updates(parsed_data):
         new_grid
         == np.array(
             parse(
-                "....>.>v.>"
-                ".v>.>v.v.v"
-                ">v>>..>v.."
-                ">>v>v>.>.v"
-                ".>v.v...v."
-                ">>.>vvv..v"
-                "..v...>>.."
-                "v...>>vv.v"
-                ">.v.v..v.v"
+                "....>.>v.>\n"
+                "v.v>.>v.v.\n"
+                ">v>>..>v..\n"
+                ">>v>v>.>.v\n"
+                ".>v.v...v.\n"
+                "v>>.>vvv..\n"
+                "..v...>>..\n"
+                "vv...>>vv.\n"
+                ">.v.v..v.v\n"
             )
         )
     ).all()
@@ -4,7 +4,6 @@ import os
 from glob import glob1
 import sys
 from shutil import copyfile, copystat
-import requests
 from datetime import date
 import logging
 from argparse import ArgumentParser
@@ -43,6 +42,9 @@ def get_input(day, year):
     else:
         cookie = os.environ["AOC_SESSION"]
 
+    # only needed for the download, so don't import it for --no-download
+    import requests
+
     url = "https://adventofcode.com/{}/day/{}/input".format(year, day)
     dayfolder = f"day{day:02d}"
     if "input.txt" in os.listdir(dayfolder):
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+import logging
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+from aoc.registry import import_times, solvers
+from aoc.runner import ROOT, run_all, print_results
+from aoc.timing import format_ns
+
+logging.basicConfig(
+    level=logging.INFO, format="%(levelname)-8s %(funcName)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument("-d", "--day", dest="days", type=int, nargs="+")
+    parser.add_argument("-j", "--jobs", type=int, help="number of worker processes (default: all cores)")
+    parser.add_argument(
+        "--timings",
+        default=os.path.join(ROOT, ".timings.json"),
+        help="timings of previous runs, used to start the slowest days first",
+    )
+    parser.add_argument("--cache-dir", default=os.path.join(ROOT, ".cache"))
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false")
+    parser.add_argument("--list", action="store_true", help="list the solvers without running them")
+    parser.add_argument("--import-times", action="store_true", help="time importing each solver")
+    args = parser.parse_args()
+
+    if args.list:
+        for day, info in solvers().items():
+            if args.days is None or day in args.days:
+                print(f"day {day:2}  functions: {', '.join(info.measured)}  imports: {', '.join(info.imports)}")
+        sys.exit(0)
+
+    if args.import_times:
+        for day in args.days or solvers():
+            total_us, modules = import_times(day)
+            heaviest = ", ".join(f"{name} {format_ns(us * 1000)}" for name, us in modules[:3])
+            print(f"day {day:2}  {format_ns(total_us * 1000):>10}  {heaviest}")
+        sys.exit(0)
+
+    start = time.perf_counter_ns()
+    results = run_all(
+        days=args.days,
+        jobs=args.jobs,
+        timings_file=args.timings,
+        cache_dir=args.cache_dir if args.use_cache else None,
+    )
+    print_results(results)
+    print(f"{'wall time':20}{format_ns(time.perf_counter_ns() - start):>12}")
+    for result in results:
+        if result["error"] is not None:
+            logger.error(f"day {result['day']} failed:\n{result['error']}")